@@ -5,15 +5,43 @@ Applies Clean Code principles: semantic naming, single responsibility,
 DRY (Don't Repeat Yourself), and Strategy Pattern for extensibility.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: only the batch update uses it
+    np = None
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional: without it njit leaves functions as they are
+    HAVE_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Quality bounds and backstage tiers. The strategies read them through their
+# class attributes, so subclasses can override them; the kernels read these.
+_MINIMUM_QUALITY = 0
+_MAXIMUM_QUALITY = 50
+_DAYS_CRITICAL_ZONE = 6   # Less than 6 days: +3
+_DAYS_URGENT_ZONE = 11    # Less than 11 days: +2
 
 
 class Item:
     """Represents an item in the Gilded Rose inventory."""
     
+    __slots__ = ('name', 'sell_in', 'quality')
+    
     def __init__(self, name: str, sell_in: int, quality: int):
-        self.name = name
+        # Interned, so strategy lookups by name match on identity
+        self.name = sys.intern(name) if type(name) is str else name
         self.sell_in = sell_in
         self.quality = quality
 
@@ -27,8 +55,10 @@ class QualityUpdater(ABC):
     Removes nested conditionals and provides semantic operations.
     """
     
-    MINIMUM_QUALITY = 0
-    MAXIMUM_QUALITY = 50
+    __slots__ = ()
+    
+    MINIMUM_QUALITY = _MINIMUM_QUALITY
+    MAXIMUM_QUALITY = _MAXIMUM_QUALITY
     
     @abstractmethod
     def update_quality(self, item: Item) -> None:
@@ -40,11 +70,38 @@ class QualityUpdater(ABC):
         """Update item sell_in value."""
         pass
     
+    def update(self, item: Item) -> None:
+        """One day for the item: update_quality(), then update_sell_in()."""
+        if type(self) in _FUSED_STRATEGIES:
+            self._update_all_fused([item])
+            return
+        self.update_quality(item)
+        self.update_sell_in(item)
+    
+    def update_all(self, items: List[Item]) -> None:
+        """
+        One day for every item in items, all handled by this strategy.
+        The built-in strategies fuse both updates in _update_all_fused(). Their
+        subclasses may override update_quality() or update_sell_in(), so they
+        and custom strategies go through update() item by item.
+        """
+        if type(self) in _FUSED_STRATEGIES:
+            self._update_all_fused(items)
+            return
+        update = self.update
+        for item in items:
+            update(item)
+    
     def clamp_quality(self, quality: int) -> int:
         """Enforce quality boundaries [0, 50] - removes code duplication."""
-        return max(self.MINIMUM_QUALITY, min(quality, self.MAXIMUM_QUALITY))
+        if quality < self.MINIMUM_QUALITY:
+            return self.MINIMUM_QUALITY
+        if quality > self.MAXIMUM_QUALITY:
+            return self.MAXIMUM_QUALITY
+        return quality
     
-    def is_expired(self, item: Item) -> bool:
+    @staticmethod
+    def is_expired(item: Item) -> bool:
         """Semantic check for expiration - improves readability."""
         return item.sell_in < 0
     
@@ -59,6 +116,8 @@ class NormalItemUpdater(QualityUpdater):
     Degrades quality by 1 before expiration, 2 after.
     """
     
+    __slots__ = ()
+    
     def update_quality(self, item: Item) -> None:
         """Decrease quality by 1 before expiration, 2 after."""
         self._degrade_quality_before_expiration(item)
@@ -70,6 +129,17 @@ class NormalItemUpdater(QualityUpdater):
         if self.is_expired(item):
             self._degrade_quality_additional_after_expiration(item)
     
+    def _update_all_fused(self, items: List[Item]) -> None:
+        """Both daily updates fused: each item is read and written once."""
+        clamp_quality = self.clamp_quality
+        for item in items:
+            sell_in = item.sell_in - 1
+            quality = clamp_quality(item.quality - 1)
+            if sell_in < 0:
+                quality = clamp_quality(quality - 1)
+            item.sell_in = sell_in
+            item.quality = quality
+    
     def _degrade_quality_before_expiration(self, item: Item) -> None:
         """Quality decreases by 1 before sell_in date."""
         item.quality = self.clamp_quality(item.quality - 1)
@@ -85,6 +155,8 @@ class AgedBrieUpdater(QualityUpdater):
     Improves quality by 1 before expiration, 2 after (opposite of normal items).
     """
     
+    __slots__ = ()
+    
     def update_quality(self, item: Item) -> None:
         """Increase quality by 1 before expiration, 2 after."""
         self._improve_quality_before_expiration(item)
@@ -96,6 +168,17 @@ class AgedBrieUpdater(QualityUpdater):
         if self.is_expired(item):
             self._improve_quality_additional_after_expiration(item)
     
+    def _update_all_fused(self, items: List[Item]) -> None:
+        """Both daily updates fused: each item is read and written once."""
+        clamp_quality = self.clamp_quality
+        for item in items:
+            sell_in = item.sell_in - 1
+            quality = clamp_quality(item.quality + 1)
+            if sell_in < 0:
+                quality = clamp_quality(quality + 1)
+            item.sell_in = sell_in
+            item.quality = quality
+    
     def _improve_quality_before_expiration(self, item: Item) -> None:
         """Quality increases by 1 before sell_in date."""
         item.quality = self.clamp_quality(item.quality + 1)
@@ -111,8 +194,10 @@ class BackstagePassUpdater(QualityUpdater):
     Implements complex logic without nested conditionals.
     """
     
-    DAYS_CRITICAL_ZONE = 6   # Less than 6 days: +3
-    DAYS_URGENT_ZONE = 11    # Less than 11 days: +2
+    __slots__ = ()
+    
+    DAYS_CRITICAL_ZONE = _DAYS_CRITICAL_ZONE
+    DAYS_URGENT_ZONE = _DAYS_URGENT_ZONE
     
     def update_quality(self, item: Item) -> None:
         """Increase quality based on urgency (days until concert)."""
@@ -125,6 +210,20 @@ class BackstagePassUpdater(QualityUpdater):
         if self.is_expired(item):
             self._expire_backstage_pass(item)
     
+    def _update_all_fused(self, items: List[Item]) -> None:
+        """Both daily updates fused: each item is read and written once."""
+        calculate_quality_increase = self._calculate_quality_increase
+        clamp_quality = self.clamp_quality
+        minimum_quality = self.MINIMUM_QUALITY
+        for item in items:
+            sell_in = item.sell_in
+            quality = clamp_quality(item.quality + calculate_quality_increase(sell_in))
+            sell_in -= 1
+            if sell_in < 0:
+                quality = minimum_quality
+            item.sell_in = sell_in
+            item.quality = quality
+    
     def _increase_quality_by_urgency(self, item: Item) -> None:
         """Increase quality based on days until concert (tiered bonuses)."""
         quality_increase = self._calculate_quality_increase(item.sell_in)
@@ -153,6 +252,8 @@ class SulfurasUpdater(QualityUpdater):
     Implements the invariant: Sulfuras never changes.
     """
     
+    __slots__ = ()
+    
     def update_quality(self, item: Item) -> None:
         """Sulfuras is legendary - quality never changes."""
         pass  # No operation - immutable
@@ -160,6 +261,26 @@ class SulfurasUpdater(QualityUpdater):
     def update_sell_in(self, item: Item) -> None:
         """Sulfuras is legendary - sell_in never changes."""
         pass  # No operation - immutable
+    
+    def _update_all_fused(self, items: List[Item]) -> None:
+        """Sulfuras is legendary - nothing changes."""
+        pass  # No operation - immutable
+
+
+# Strategies whose _update_all_fused() stands in for update() and update_all();
+# exact classes only, since subclasses may override the split updates
+_FUSED_STRATEGIES = frozenset({
+    NormalItemUpdater,
+    AgedBrieUpdater,
+    BackstagePassUpdater,
+    SulfurasUpdater,
+})
+
+# Strategies hold no state, so one shared instance of each is enough
+NORMAL_UPDATER = NormalItemUpdater()
+BRIE_UPDATER = AgedBrieUpdater()
+BACKSTAGE_UPDATER = BackstagePassUpdater()
+SULFURAS_UPDATER = SulfurasUpdater()
 
 
 class ItemUpdaterFactory:
@@ -172,24 +293,158 @@ class ItemUpdaterFactory:
     def __init__(self):
         """Initialize with all known item type strategies."""
         self._strategies = {
-            "Aged Brie": AgedBrieUpdater(),
-            "Backstage passes to a TAFKAL80ETC concert": BackstagePassUpdater(),
-            "Sulfuras, Hand of Ragnaros": SulfurasUpdater(),
+            sys.intern("Aged Brie"): BRIE_UPDATER,
+            sys.intern("Backstage passes to a TAFKAL80ETC concert"): BACKSTAGE_UPDATER,
+            sys.intern("Sulfuras, Hand of Ragnaros"): SULFURAS_UPDATER,
         }
+        # item name -> its strategy's update_all method, or None for legendary
+        # items; filled by get_handler()
+        self._handlers = {}
     
     def get_updater(self, item_name: str) -> QualityUpdater:
         """
         Get the appropriate strategy for an item.
         Returns NormalItemUpdater for unknown types (default).
         """
-        return self._strategies.get(item_name, NormalItemUpdater())
+        return self._strategies.get(item_name, NORMAL_UPDATER)
+    
+    def get_handler(self, item_name: str) -> Optional[Callable[[List[Item]], None]]:
+        """
+        Get the update_all method of an item's strategy, or None for legendary
+        items, which never change. Cached per name until a strategy is registered.
+        """
+        try:
+            return self._handlers[item_name]
+        except KeyError:
+            pass
+        updater = self.get_updater(item_name)
+        handler = None if type(updater) is SulfurasUpdater else updater.update_all
+        self._handlers[item_name] = handler
+        return handler
     
     def register_strategy(self, item_name: str, updater: QualityUpdater) -> None:
         """
         Register a new item type strategy.
         Allows runtime addition of new item types without modifying existing code.
         """
+        if type(item_name) is str:
+            item_name = sys.intern(item_name)
         self._strategies[item_name] = updater
+        self._handlers.clear()
+
+
+# Item kinds stored by GildedRoseBatch
+KIND_NORMAL = 0
+KIND_AGED_BRIE = 1
+KIND_BACKSTAGE_PASS = 2
+KIND_LEGENDARY = 3
+
+_VECTORIZED_KINDS = {
+    NormalItemUpdater: KIND_NORMAL,
+    AgedBrieUpdater: KIND_AGED_BRIE,
+    BackstagePassUpdater: KIND_BACKSTAGE_PASS,
+    SulfurasUpdater: KIND_LEGENDARY,
+}
+
+# Quality step before clamping, by [kind][sell_in - _STEP_SELL_IN_LOW]. Only
+# backstage passes depend on sell_in, and only between their tiers, so sell_in
+# is clipped to [_STEP_SELL_IN_LOW, _STEP_SELL_IN_HIGH] before indexing.
+_STEP_SELL_IN_LOW = _DAYS_CRITICAL_ZONE - 1
+_STEP_SELL_IN_HIGH = _DAYS_URGENT_ZONE
+_QUALITY_STEPS = (
+    (-1,) * (_STEP_SELL_IN_HIGH - _STEP_SELL_IN_LOW + 1),
+    (1,) * (_STEP_SELL_IN_HIGH - _STEP_SELL_IN_LOW + 1),
+    tuple(
+        3 if sell_in < _DAYS_CRITICAL_ZONE else 2 if sell_in < _DAYS_URGENT_ZONE else 1
+        for sell_in in range(_STEP_SELL_IN_LOW, _STEP_SELL_IN_HIGH + 1)
+    ),
+    (0,) * (_STEP_SELL_IN_HIGH - _STEP_SELL_IN_LOW + 1),
+)
+_QUALITY_STEP_TABLE = np.array(_QUALITY_STEPS, dtype=np.int64) if np is not None else None
+
+
+@njit(cache=True)
+def _clamp_q_njit(quality: int) -> int:
+    """Quality clamped to [0, 50]; compiles to two conditional moves under Numba."""
+    if quality > _MINIMUM_QUALITY:
+        return quality if quality < _MAXIMUM_QUALITY else _MAXIMUM_QUALITY
+    return _MINIMUM_QUALITY
+
+
+@njit(cache=True)
+def _update_item_jit(kind: int, sell_in: int, quality: int):
+    """
+    One day of the built-in strategies' rules for a single item, in one function.
+    Returns the new (sell_in, quality). Compiled by Numba when it is installed.
+    """
+    if kind == KIND_LEGENDARY:
+        return sell_in, quality
+    if kind == KIND_BACKSTAGE_PASS:
+        if sell_in < _DAYS_CRITICAL_ZONE:
+            step = 3
+        elif sell_in < _DAYS_URGENT_ZONE:
+            step = 2
+        else:
+            step = 1
+    elif kind == KIND_AGED_BRIE:
+        step = 1
+    else:
+        step = -1
+    quality = _clamp_q_njit(quality + step)
+    sell_in -= 1
+    if sell_in < 0:
+        if kind == KIND_BACKSTAGE_PASS:
+            quality = _MINIMUM_QUALITY
+        else:
+            quality = _clamp_q_njit(quality + step)
+    return sell_in, quality
+
+
+@njit(cache=True, parallel=True)
+def _update_batch_jit(kinds, sell_in, quality) -> None:
+    """_update_item_jit() over whole arrays, in place; iterations run in parallel."""
+    for index in prange(len(kinds)):
+        sell_in[index], quality[index] = _update_item_jit(kinds[index], sell_in[index], quality[index])
+
+
+# (kind, sell_in, quality) -> (new sell_in, new quality): one day's update
+# depends on nothing else, so results can be shared between items and days
+_TRANSITION_CACHE: Dict[Tuple[int, int, int], Tuple[int, int]] = {}
+_TRANSITION_CACHE_SIZE = 100_000
+
+
+def _cached_transition(kind: int, sell_in: int, quality: int) -> Tuple[int, int]:
+    """_update_item_jit() memoized, dropping the oldest entry once the cache is full."""
+    key = (kind, sell_in, quality)
+    result = _TRANSITION_CACHE.get(key)
+    if result is None:
+        result = _update_item_jit(kind, sell_in, quality)
+        if len(_TRANSITION_CACHE) >= _TRANSITION_CACHE_SIZE:
+            del _TRANSITION_CACHE[next(iter(_TRANSITION_CACHE))]
+        _TRANSITION_CACHE[key] = result
+    return result
+
+
+def _update_arrays(kind, sell_in, quality):
+    """
+    One day of the built-in rules over NumPy arrays of non-legendary items.
+    Returns the new (sell_in, quality) arrays; the inputs are left untouched.
+    """
+    normal = kind == KIND_NORMAL
+    backstage = kind == KIND_BACKSTAGE_PASS
+    
+    # Daily quality change, decided before sell_in moves
+    tier = np.clip(sell_in, _STEP_SELL_IN_LOW, _STEP_SELL_IN_HIGH) - _STEP_SELL_IN_LOW
+    step = _QUALITY_STEP_TABLE[kind, tier]
+    quality = np.clip(quality + step, _MINIMUM_QUALITY, _MAXIMUM_QUALITY)
+    
+    sell_in = sell_in - 1
+    expired = sell_in < 0
+    # Expired items get the same change again; passes lose everything
+    extra = np.where(normal, -1, 1)
+    quality = np.where(expired, np.clip(quality + extra, _MINIMUM_QUALITY, _MAXIMUM_QUALITY), quality)
+    quality = np.where(expired & backstage, _MINIMUM_QUALITY, quality)
+    return sell_in, quality
 
 
 class GildedRose:
@@ -210,9 +465,24 @@ class GildedRose:
         self._updater_factory = ItemUpdaterFactory()
     
     def update_quality(self) -> None:
-        """Update quality for all items in inventory."""
+        """
+        Update quality for all items in inventory.
+        Items are grouped by name first, so each group goes to its strategy's
+        update_all() in one call, as returned by the factory's get_handler().
+        Legendary items never change, so they get no handlers and are skipped.
+        """
+        groups = {}
         for item in self.items:
-            self._update_single_item(item)
+            group = groups.get(item.name)
+            if group is None:
+                group = groups[item.name] = []
+            group.append(item)
+        
+        get_handler = self._updater_factory.get_handler
+        for name, group in groups.items():
+            handler = get_handler(name)
+            if handler is not None:
+                handler(group)
     
     def _update_single_item(self, item: Item) -> None:
         """
@@ -220,6 +490,52 @@ class GildedRose:
         Delegates to the strategy pattern for type-specific logic.
         Note: First update quality, then update sell_in (which may apply post-expiration logic).
         """
-        updater = self._updater_factory.get_updater(item.name)
-        updater.update_quality(item)
-        updater.update_sell_in(item)
+        self._updater_factory.get_updater(item.name).update(item)
+
+
+class GildedRoseBatch:
+    """
+    Inventory stored as parallel arrays (names, kinds, sell_in, quality)
+    instead of Item objects, for large inventories of the built-in item types.
+    
+    update_quality() applies one day to every item at once: in a compiled
+    parallel loop when Numba is installed, with NumPy masks otherwise. Without
+    NumPy the arrays are plain lists updated item by item. Custom strategies
+    are not supported: every name maps to one of the built-in kinds.
+    """
+    
+    def __init__(self, items: List[Item]):
+        factory = ItemUpdaterFactory()
+        self.names = [item.name for item in items]
+        kinds = [_VECTORIZED_KINDS[type(factory.get_updater(item.name))] for item in items]
+        sell_in = [item.sell_in for item in items]
+        quality = [item.quality for item in items]
+        if np is None:
+            self.kinds, self.sell_in, self.quality = kinds, sell_in, quality
+        else:
+            self.kinds = np.array(kinds, dtype=np.int8)
+            self.sell_in = np.array(sell_in, dtype=np.int64)
+            self.quality = np.array(quality, dtype=np.int64)
+    
+    def update_quality(self) -> None:
+        """Advance the whole batch by one day, in place."""
+        if np is None:
+            for index, kind in enumerate(self.kinds):
+                self.sell_in[index], self.quality[index] = _cached_transition(
+                    kind, self.sell_in[index], self.quality[index]
+                )
+            return
+        if HAVE_NUMBA:
+            _update_batch_jit(self.kinds, self.sell_in, self.quality)
+            return
+        
+        moving = self.kinds != KIND_LEGENDARY
+        self.sell_in[moving], self.quality[moving] = _update_arrays(
+            self.kinds[moving], self.sell_in[moving], self.quality[moving]
+        )
+    
+    def to_items(self) -> List[Item]:
+        """Build Item objects from the current state of the batch."""
+        sell_in = self.sell_in if np is None else self.sell_in.tolist()
+        quality = self.quality if np is None else self.quality.tolist()
+        return [Item(name, days, value) for name, days, value in zip(self.names, sell_in, quality)]
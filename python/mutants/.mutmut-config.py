@@ -1,35 +1,99 @@
-from inspect import signature as _mutmut_signature
-from typing import Annotated
-from typing import Callable
-from typing import ClassVar
+from __future__ import annotations
 
+import os
+import sys
 
-MutantDict = Annotated[dict[str, Callable], "Mutant"]
+# Same meaning as typing.TYPE_CHECKING without importing typing at runtime.
+TYPE_CHECKING = False
 
+try:
+    from mutmut.__main__ import MutmutProgrammaticFailException
+    from mutmut.__main__ import record_trampoline_hit
+except ImportError:
+    MutmutProgrammaticFailException = None
+    record_trampoline_hit = None
 
-def _mutmut_trampoline(orig, mutants, call_args, call_kwargs, self_arg = None):
-    """Forward call to original or mutated function, depending on the environment"""
-    import os
-    mutant_under_test = os.environ['MUTANT_UNDER_TEST']
+if TYPE_CHECKING:
+    # Only static checkers read these; annotations are not evaluated at runtime.
+    from typing import Annotated
+    from typing import Callable
+    from typing import ClassVar
+
+    MutantTable = Annotated[tuple[tuple[str, Callable], ...], "Mutant"]
+
+# Read at import, and again by _refresh_mutant_env(), which tests/conftest.py
+# calls before every pytest session: mutmut changes it after import.
+# Both strings are interned so comparing them against the (compiler-interned)
+# mutant name literals below short-circuits on identity.
+_MUTANT_UNDER_TEST = sys.intern(os.environ.get('MUTANT_UNDER_TEST', ''))
+_MUTANT_KEY = sys.intern(_MUTANT_UNDER_TEST.rpartition('.')[-1])
+
+
+# function -> selected mutant (None for the original); valid for the current
+# MUTANT_UNDER_TEST only, so _refresh_mutant_env() clears it.
+_MUTMUT_RESOLVED = {}
+
+
+def _refresh_mutant_env():
+    """Re-read MUTANT_UNDER_TEST after it was changed in-process, and rebind pre_mutation"""
+    global _MUTANT_UNDER_TEST, _MUTANT_KEY
+    _MUTANT_UNDER_TEST = sys.intern(os.environ.get('MUTANT_UNDER_TEST', ''))
+    _MUTANT_KEY = sys.intern(_MUTANT_UNDER_TEST.rpartition('.')[-1])
+    _MUTMUT_RESOLVED.clear()
+    _bind_pre_mutation()
+
+
+def _mutmut_resolve(func, mutants):
+    """Return the mutant of func selected by the environment, or None for the original"""
+    try:
+        return _MUTMUT_RESOLVED[func]
+    except KeyError:
+        pass
+    mutant = None
+    if _MUTANT_UNDER_TEST[:func._mutmut_prefix_len] == func._mutmut_prefix:
+        for name, candidate in mutants:
+            if name == _MUTANT_KEY:
+                mutant = candidate
+                break
+        else:
+            raise KeyError(_MUTANT_KEY)
+    _MUTMUT_RESOLVED[func] = mutant
+    return mutant
+
+
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+
+
+def _mutmut_compile_wrapper(orig, first_line, namespace):
+    """exec a wrapper with orig's own positional parameters, or return None if orig has others"""
+    code = orig.__code__
+    if code.co_flags & (_CO_VARARGS | _CO_VARKEYWORDS) or code.co_kwonlyargcount or orig.__defaults__:
+        return None
+    params = ', '.join(code.co_varnames[:code.co_argcount])
+    exec(f"def wrapper({params}):\n    {first_line}\n    return _target({params})\n", namespace)
+    return namespace['wrapper']
+
+
+def _mutmut_specialize(orig, mutants):
+    """Return what pre_mutation runs for the current MUTANT_UNDER_TEST"""
+    mutant_under_test = _MUTANT_UNDER_TEST
     if mutant_under_test == 'fail':
-        from mutmut.__main__ import MutmutProgrammaticFailException
-        raise MutmutProgrammaticFailException('Failed programmatically')      
+        def fail(*args, **kwargs):
+            raise MutmutProgrammaticFailException('Failed programmatically')
+        return fail
     elif mutant_under_test == 'stats':
-        from mutmut.__main__ import record_trampoline_hit
-        record_trampoline_hit(orig.__module__ + '.' + orig.__name__)
-        result = orig(*call_args, **call_kwargs)
-        return result
-    prefix = orig.__module__ + '.' + orig.__name__ + '__mutmut_'
-    if not mutant_under_test.startswith(prefix):
-        result = orig(*call_args, **call_kwargs)
-        return result
-    mutant_name = mutant_under_test.rpartition('.')[-1]
-    if self_arg is not None:
-        # call to a class method where self is not bound
-        result = mutants[mutant_name](self_arg, *call_args, **call_kwargs)
-    else:
-        result = mutants[mutant_name](*call_args, **call_kwargs)
-    return result
+        namespace = {'_hit': record_trampoline_hit, '_fqn': orig.__module__ + '.' + orig.__name__, '_target': orig}
+        stats = _mutmut_compile_wrapper(orig, '_hit(_fqn)', namespace)
+        if stats is None:
+            def stats(*args, **kwargs):
+                record_trampoline_hit(orig.__module__ + '.' + orig.__name__)
+                return orig(*args, **kwargs)
+        return stats
+    mutant = _mutmut_resolve(orig, mutants)
+    if mutant is None:
+        return orig
+    return mutant
 def x_pre_mutation__mutmut_orig(context):
     """Configuration for mutmut mutation testing"""
     # Only mutate the gilded_rose.py file
@@ -61,17 +125,30 @@ def x_pre_mutation__mutmut_5(context):
     if "gilded_rose.py" not in context.filename:
         context.skip = False
 
-x_pre_mutation__mutmut_mutants : ClassVar[MutantDict] = {
-'x_pre_mutation__mutmut_1': x_pre_mutation__mutmut_1, 
-    'x_pre_mutation__mutmut_2': x_pre_mutation__mutmut_2, 
-    'x_pre_mutation__mutmut_3': x_pre_mutation__mutmut_3, 
-    'x_pre_mutation__mutmut_4': x_pre_mutation__mutmut_4, 
-    'x_pre_mutation__mutmut_5': x_pre_mutation__mutmut_5
-}
-
-def pre_mutation(*args, **kwargs):
-    result = _mutmut_trampoline(x_pre_mutation__mutmut_orig, x_pre_mutation__mutmut_mutants, args, kwargs)
-    return result 
+x_pre_mutation__mutmut_mutants : ClassVar[MutantTable] = (
+    ('x_pre_mutation__mutmut_1', x_pre_mutation__mutmut_1),
+    ('x_pre_mutation__mutmut_2', x_pre_mutation__mutmut_2),
+    ('x_pre_mutation__mutmut_3', x_pre_mutation__mutmut_3),
+    ('x_pre_mutation__mutmut_4', x_pre_mutation__mutmut_4),
+    ('x_pre_mutation__mutmut_5', x_pre_mutation__mutmut_5),
+)
 
-pre_mutation.__signature__ = _mutmut_signature(x_pre_mutation__mutmut_orig)
 x_pre_mutation__mutmut_orig.__name__ = 'x_pre_mutation'
+x_pre_mutation__mutmut_orig._mutmut_prefix = x_pre_mutation__mutmut_orig.__module__ + '.' + x_pre_mutation__mutmut_orig.__name__ + '__mutmut_'
+x_pre_mutation__mutmut_orig._mutmut_prefix_len = len(x_pre_mutation__mutmut_orig._mutmut_prefix)
+
+def _bind_pre_mutation():
+    """Bind pre_mutation straight to the callable selected by MUTANT_UNDER_TEST"""
+    global pre_mutation
+    if not _MUTANT_UNDER_TEST:
+        # Not running under mutmut: skip the mutant lookup and signature work.
+        pre_mutation = x_pre_mutation__mutmut_orig
+        return
+    pre_mutation = _mutmut_specialize(x_pre_mutation__mutmut_orig, x_pre_mutation__mutmut_mutants)
+    # The original already carries the right signature; the mutants and
+    # wrappers get it copied, so inspect is only loaded for those.
+    if pre_mutation is not x_pre_mutation__mutmut_orig and _MUTANT_UNDER_TEST != 'fail':
+        from inspect import signature
+        pre_mutation.__signature__ = signature(x_pre_mutation__mutmut_orig)
+
+_bind_pre_mutation()
@@ -5,6 +5,7 @@ Applies Clean Code principles: semantic naming, single responsibility,
 DRY (Don't Repeat Yourself), and Strategy Pattern for extensibility.
 """
 
+import os
 from abc import ABC, abstractmethod
 from typing import List
 from inspect import signature as _mutmut_signature
@@ -13,37 +14,119 @@ from typing import Callable
 from typing import ClassVar
 
 
-MutantDict = Annotated[dict[str, Callable], "Mutant"]
+MutantTable = Annotated[tuple[tuple[str, Callable], ...], "Mutant"]
+
+# Read at import, and again by _refresh_mutant_env(), which tests/conftest.py
+# calls before every pytest session: mutmut changes it after import.
+_MUTANT = os.environ.get('MUTANT_UNDER_TEST', '')
+
+# MUTMUT_DISABLED=1: plain release build, every method bound to its original
+# and the mutants dropped from the classes (see the end of the module).
+_RELEASE = os.environ.get('MUTMUT_DISABLED') == '1'
 
 
 def _mutmut_trampoline(orig, mutants, call_args, call_kwargs, self_arg = None):
-    """Forward call to original or mutated function, depending on the environment"""
-    import os
+    """Forward call for mutmut's 'fail' and 'stats' runs, the only ones bound to the trampoline"""
+    # Not _MUTANT: mutmut switches the variable in-process and in forked children
     mutant_under_test = os.environ['MUTANT_UNDER_TEST']
     if mutant_under_test == 'fail':
         from mutmut.__main__ import MutmutProgrammaticFailException
         raise MutmutProgrammaticFailException('Failed programmatically')      
-    elif mutant_under_test == 'stats':
-        from mutmut.__main__ import record_trampoline_hit
-        record_trampoline_hit(orig.__module__ + '.' + orig.__name__)
-        result = orig(*call_args, **call_kwargs)
-        return result
-    prefix = orig.__module__ + '.' + orig.__name__ + '__mutmut_'
-    if not mutant_under_test.startswith(prefix):
-        result = orig(*call_args, **call_kwargs)
-        return result
-    mutant_name = mutant_under_test.rpartition('.')[-1]
     if self_arg is not None:
         # call to a class method where self is not bound
-        result = mutants[mutant_name](self_arg, *call_args, **call_kwargs)
-    else:
-        result = mutants[mutant_name](*call_args, **call_kwargs)
+        call_args = (self_arg,) + call_args
+    if mutant_under_test == 'stats':
+        from mutmut.__main__ import record_trampoline_hit
+        record_trampoline_hit(orig.__module__ + '.' + orig.__name__)
+    result = orig(*call_args, **call_kwargs)
     return result
 
 
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+
+
+def _mutmut_wrapper(orig, mutants):
+    """Build a method's trampoline wrapper, with orig, mutants and the trampoline in its closure"""
+    code = orig.__code__
+    class_name, method_name = orig.__name__.split('ǁ')[1:]
+    method_name = method_name[:-len('__mutmut_orig')]
+    if code.co_flags & (_CO_VARARGS | _CO_VARKEYWORDS) or code.co_kwonlyargcount or orig.__defaults__:
+        # Only plain positional parameters can be spelled out; others keep mutmut's generic wrapper
+        def wrapper(self, *args, **kwargs):
+            return _mutmut_trampoline(orig, mutants, args, kwargs, self)
+        wrapper.__name__ = method_name
+    else:
+        params = code.co_varnames[1:code.co_argcount]
+        namespace = {}
+        exec(
+            f"def make(orig, mutants, _mutmut_trampoline):\n"
+            f"    def {method_name}(self{''.join(', ' + p for p in params)}):\n"
+            f"        return _mutmut_trampoline(orig, mutants, ({''.join(p + ', ' for p in params)}), {{}}, self)\n"
+            f"    return {method_name}\n",
+            namespace,
+        )
+        wrapper = namespace['make'](orig, mutants, _mutmut_trampoline)
+    wrapper.__qualname__ = class_name + '.' + method_name
+    return wrapper
+
+
+# (name, orig, mutants, trampolined) of every method bound by _mutmut_bind,
+# for _mutmut_rebind
+_MUTMUT_METHODS = []
+
+
+def _refresh_mutant_env():
+    """Re-read MUTANT_UNDER_TEST after it was changed in-process, and rebind to it"""
+    global _MUTANT
+    _MUTANT = os.environ.get('MUTANT_UNDER_TEST', '')
+    _mutmut_rebind(_MUTANT)
+
+
+def _mutmut_select(name, orig, mutants, mutant_under_test):
+    """Return the function a method runs for mutant_under_test: its mutant, or orig"""
+    prefix = __name__ + '.' + name + '__mutmut_'
+    if not mutant_under_test.startswith(prefix):
+        return orig
+    return _mutmut_lookup(mutants, mutant_under_test.rpartition('.')[-1])
+
+
+def _mutmut_lookup(mutants, mutant_name):
+    """Return the function of mutant_name from a (name, function) table"""
+    for name, mutant in mutants:
+        if name == mutant_name:
+            return mutant
+    raise KeyError(mutant_name)
+
+
+def _mutmut_choose(name, orig, mutants, trampolined, mutant_under_test):
+    """Return what a method name is bound to while mutant_under_test is set"""
+    if mutant_under_test in ('fail', 'stats'):
+        # mutmut's own bookkeeping runs keep going through the trampoline
+        return trampolined
+    return _mutmut_select(name, orig, mutants, mutant_under_test)
+
+
+def _mutmut_bind(name, orig, mutants, trampolined):
+    """Pick once, at class creation, what a method name is bound to"""
+    if _RELEASE:
+        return orig
+    _MUTMUT_METHODS.append((name, orig, mutants, trampolined))
+    return _mutmut_choose(name, orig, mutants, trampolined, _MUTANT)
+
+
+def _mutmut_rebind(mutant_under_test):
+    """Bind every instrumented method to what it runs for mutant_under_test"""
+    for name, orig, mutants, trampolined in _MUTMUT_METHODS:
+        _, class_name, method_name = name.split('ǁ')
+        setattr(globals()[class_name], method_name, _mutmut_choose(name, orig, mutants, trampolined, mutant_under_test))
+
+
 class Item:
     """Represents an item in the Gilded Rose inventory."""
     
+    __slots__ = ('name', 'sell_in', 'quality')
+    
     def xǁItemǁ__init____mutmut_orig(self, name: str, sell_in: int, quality: int):
         self.name = name
         self.sell_in = sell_in
@@ -64,18 +147,17 @@ class Item:
         self.sell_in = sell_in
         self.quality = None
     
-    xǁItemǁ__init____mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁItemǁ__init____mutmut_1': xǁItemǁ__init____mutmut_1, 
-        'xǁItemǁ__init____mutmut_2': xǁItemǁ__init____mutmut_2, 
-        'xǁItemǁ__init____mutmut_3': xǁItemǁ__init____mutmut_3
-    }
+    xǁItemǁ__init____mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁItemǁ__init____mutmut_1', xǁItemǁ__init____mutmut_1),
+        ('xǁItemǁ__init____mutmut_2', xǁItemǁ__init____mutmut_2),
+        ('xǁItemǁ__init____mutmut_3', xǁItemǁ__init____mutmut_3),
+    )
     
-    def __init__(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁItemǁ__init____mutmut_orig"), object.__getattribute__(self, "xǁItemǁ__init____mutmut_mutants"), args, kwargs, self)
-        return result 
+    __init__ = _mutmut_wrapper(xǁItemǁ__init____mutmut_orig, xǁItemǁ__init____mutmut_mutants)
     
     __init__.__signature__ = _mutmut_signature(xǁItemǁ__init____mutmut_orig)
     xǁItemǁ__init____mutmut_orig.__name__ = 'xǁItemǁ__init__'
+    __init__ = _mutmut_bind('xǁItemǁ__init__', xǁItemǁ__init____mutmut_orig, xǁItemǁ__init____mutmut_mutants, __init__)
 
     def __repr__(self) -> str:
         return f"{self.name}, {self.sell_in}, {self.quality}"
@@ -136,23 +218,22 @@ class QualityUpdater(ABC):
         """Enforce quality boundaries [0, 50] - removes code duplication."""
         return max(self.MINIMUM_QUALITY, min(quality, ))
     
-    xǁQualityUpdaterǁclamp_quality__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁQualityUpdaterǁclamp_quality__mutmut_1': xǁQualityUpdaterǁclamp_quality__mutmut_1, 
-        'xǁQualityUpdaterǁclamp_quality__mutmut_2': xǁQualityUpdaterǁclamp_quality__mutmut_2, 
-        'xǁQualityUpdaterǁclamp_quality__mutmut_3': xǁQualityUpdaterǁclamp_quality__mutmut_3, 
-        'xǁQualityUpdaterǁclamp_quality__mutmut_4': xǁQualityUpdaterǁclamp_quality__mutmut_4, 
-        'xǁQualityUpdaterǁclamp_quality__mutmut_5': xǁQualityUpdaterǁclamp_quality__mutmut_5, 
-        'xǁQualityUpdaterǁclamp_quality__mutmut_6': xǁQualityUpdaterǁclamp_quality__mutmut_6, 
-        'xǁQualityUpdaterǁclamp_quality__mutmut_7': xǁQualityUpdaterǁclamp_quality__mutmut_7, 
-        'xǁQualityUpdaterǁclamp_quality__mutmut_8': xǁQualityUpdaterǁclamp_quality__mutmut_8
-    }
-    
-    def clamp_quality(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁQualityUpdaterǁclamp_quality__mutmut_orig"), object.__getattribute__(self, "xǁQualityUpdaterǁclamp_quality__mutmut_mutants"), args, kwargs, self)
-        return result 
+    xǁQualityUpdaterǁclamp_quality__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_1', xǁQualityUpdaterǁclamp_quality__mutmut_1),
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_2', xǁQualityUpdaterǁclamp_quality__mutmut_2),
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_3', xǁQualityUpdaterǁclamp_quality__mutmut_3),
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_4', xǁQualityUpdaterǁclamp_quality__mutmut_4),
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_5', xǁQualityUpdaterǁclamp_quality__mutmut_5),
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_6', xǁQualityUpdaterǁclamp_quality__mutmut_6),
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_7', xǁQualityUpdaterǁclamp_quality__mutmut_7),
+        ('xǁQualityUpdaterǁclamp_quality__mutmut_8', xǁQualityUpdaterǁclamp_quality__mutmut_8),
+    )
+    
+    clamp_quality = _mutmut_wrapper(xǁQualityUpdaterǁclamp_quality__mutmut_orig, xǁQualityUpdaterǁclamp_quality__mutmut_mutants)
     
     clamp_quality.__signature__ = _mutmut_signature(xǁQualityUpdaterǁclamp_quality__mutmut_orig)
     xǁQualityUpdaterǁclamp_quality__mutmut_orig.__name__ = 'xǁQualityUpdaterǁclamp_quality'
+    clamp_quality = _mutmut_bind('xǁQualityUpdaterǁclamp_quality', xǁQualityUpdaterǁclamp_quality__mutmut_orig, xǁQualityUpdaterǁclamp_quality__mutmut_mutants, clamp_quality)
     
     def xǁQualityUpdaterǁis_expired__mutmut_orig(self, item: Item) -> bool:
         """Semantic check for expiration - improves readability."""
@@ -166,17 +247,16 @@ class QualityUpdater(ABC):
         """Semantic check for expiration - improves readability."""
         return item.sell_in < 1
     
-    xǁQualityUpdaterǁis_expired__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁQualityUpdaterǁis_expired__mutmut_1': xǁQualityUpdaterǁis_expired__mutmut_1, 
-        'xǁQualityUpdaterǁis_expired__mutmut_2': xǁQualityUpdaterǁis_expired__mutmut_2
-    }
+    xǁQualityUpdaterǁis_expired__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁQualityUpdaterǁis_expired__mutmut_1', xǁQualityUpdaterǁis_expired__mutmut_1),
+        ('xǁQualityUpdaterǁis_expired__mutmut_2', xǁQualityUpdaterǁis_expired__mutmut_2),
+    )
     
-    def is_expired(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁQualityUpdaterǁis_expired__mutmut_orig"), object.__getattribute__(self, "xǁQualityUpdaterǁis_expired__mutmut_mutants"), args, kwargs, self)
-        return result 
+    is_expired = _mutmut_wrapper(xǁQualityUpdaterǁis_expired__mutmut_orig, xǁQualityUpdaterǁis_expired__mutmut_mutants)
     
     is_expired.__signature__ = _mutmut_signature(xǁQualityUpdaterǁis_expired__mutmut_orig)
     xǁQualityUpdaterǁis_expired__mutmut_orig.__name__ = 'xǁQualityUpdaterǁis_expired'
+    is_expired = _mutmut_bind('xǁQualityUpdaterǁis_expired', xǁQualityUpdaterǁis_expired__mutmut_orig, xǁQualityUpdaterǁis_expired__mutmut_mutants, is_expired)
     
     def xǁQualityUpdaterǁdecrease_sell_in__mutmut_orig(self, item: Item) -> None:
         """Semantic method for sell_in decrement."""
@@ -194,18 +274,17 @@ class QualityUpdater(ABC):
         """Semantic method for sell_in decrement."""
         item.sell_in -= 2
     
-    xǁQualityUpdaterǁdecrease_sell_in__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁQualityUpdaterǁdecrease_sell_in__mutmut_1': xǁQualityUpdaterǁdecrease_sell_in__mutmut_1, 
-        'xǁQualityUpdaterǁdecrease_sell_in__mutmut_2': xǁQualityUpdaterǁdecrease_sell_in__mutmut_2, 
-        'xǁQualityUpdaterǁdecrease_sell_in__mutmut_3': xǁQualityUpdaterǁdecrease_sell_in__mutmut_3
-    }
+    xǁQualityUpdaterǁdecrease_sell_in__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁQualityUpdaterǁdecrease_sell_in__mutmut_1', xǁQualityUpdaterǁdecrease_sell_in__mutmut_1),
+        ('xǁQualityUpdaterǁdecrease_sell_in__mutmut_2', xǁQualityUpdaterǁdecrease_sell_in__mutmut_2),
+        ('xǁQualityUpdaterǁdecrease_sell_in__mutmut_3', xǁQualityUpdaterǁdecrease_sell_in__mutmut_3),
+    )
     
-    def decrease_sell_in(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁQualityUpdaterǁdecrease_sell_in__mutmut_orig"), object.__getattribute__(self, "xǁQualityUpdaterǁdecrease_sell_in__mutmut_mutants"), args, kwargs, self)
-        return result 
+    decrease_sell_in = _mutmut_wrapper(xǁQualityUpdaterǁdecrease_sell_in__mutmut_orig, xǁQualityUpdaterǁdecrease_sell_in__mutmut_mutants)
     
     decrease_sell_in.__signature__ = _mutmut_signature(xǁQualityUpdaterǁdecrease_sell_in__mutmut_orig)
     xǁQualityUpdaterǁdecrease_sell_in__mutmut_orig.__name__ = 'xǁQualityUpdaterǁdecrease_sell_in'
+    decrease_sell_in = _mutmut_bind('xǁQualityUpdaterǁdecrease_sell_in', xǁQualityUpdaterǁdecrease_sell_in__mutmut_orig, xǁQualityUpdaterǁdecrease_sell_in__mutmut_mutants, decrease_sell_in)
 
 
 class NormalItemUpdater(QualityUpdater):
@@ -222,16 +301,15 @@ class NormalItemUpdater(QualityUpdater):
         """Decrease quality by 1 before expiration, 2 after."""
         self._degrade_quality_before_expiration(None)
     
-    xǁNormalItemUpdaterǁupdate_quality__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁNormalItemUpdaterǁupdate_quality__mutmut_1': xǁNormalItemUpdaterǁupdate_quality__mutmut_1
-    }
+    xǁNormalItemUpdaterǁupdate_quality__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁNormalItemUpdaterǁupdate_quality__mutmut_1', xǁNormalItemUpdaterǁupdate_quality__mutmut_1),
+    )
     
-    def update_quality(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁNormalItemUpdaterǁupdate_quality__mutmut_orig"), object.__getattribute__(self, "xǁNormalItemUpdaterǁupdate_quality__mutmut_mutants"), args, kwargs, self)
-        return result 
+    update_quality = _mutmut_wrapper(xǁNormalItemUpdaterǁupdate_quality__mutmut_orig, xǁNormalItemUpdaterǁupdate_quality__mutmut_mutants)
     
     update_quality.__signature__ = _mutmut_signature(xǁNormalItemUpdaterǁupdate_quality__mutmut_orig)
     xǁNormalItemUpdaterǁupdate_quality__mutmut_orig.__name__ = 'xǁNormalItemUpdaterǁupdate_quality'
+    update_quality = _mutmut_bind('xǁNormalItemUpdaterǁupdate_quality', xǁNormalItemUpdaterǁupdate_quality__mutmut_orig, xǁNormalItemUpdaterǁupdate_quality__mutmut_mutants, update_quality)
     
     def xǁNormalItemUpdaterǁupdate_sell_in__mutmut_orig(self, item: Item) -> None:
         """Decrease sell_in by 1 each day."""
@@ -261,18 +339,17 @@ class NormalItemUpdater(QualityUpdater):
         if self.is_expired(item):
             self._degrade_quality_additional_after_expiration(None)
     
-    xǁNormalItemUpdaterǁupdate_sell_in__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁNormalItemUpdaterǁupdate_sell_in__mutmut_1': xǁNormalItemUpdaterǁupdate_sell_in__mutmut_1, 
-        'xǁNormalItemUpdaterǁupdate_sell_in__mutmut_2': xǁNormalItemUpdaterǁupdate_sell_in__mutmut_2, 
-        'xǁNormalItemUpdaterǁupdate_sell_in__mutmut_3': xǁNormalItemUpdaterǁupdate_sell_in__mutmut_3
-    }
+    xǁNormalItemUpdaterǁupdate_sell_in__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁNormalItemUpdaterǁupdate_sell_in__mutmut_1', xǁNormalItemUpdaterǁupdate_sell_in__mutmut_1),
+        ('xǁNormalItemUpdaterǁupdate_sell_in__mutmut_2', xǁNormalItemUpdaterǁupdate_sell_in__mutmut_2),
+        ('xǁNormalItemUpdaterǁupdate_sell_in__mutmut_3', xǁNormalItemUpdaterǁupdate_sell_in__mutmut_3),
+    )
     
-    def update_sell_in(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁNormalItemUpdaterǁupdate_sell_in__mutmut_orig"), object.__getattribute__(self, "xǁNormalItemUpdaterǁupdate_sell_in__mutmut_mutants"), args, kwargs, self)
-        return result 
+    update_sell_in = _mutmut_wrapper(xǁNormalItemUpdaterǁupdate_sell_in__mutmut_orig, xǁNormalItemUpdaterǁupdate_sell_in__mutmut_mutants)
     
     update_sell_in.__signature__ = _mutmut_signature(xǁNormalItemUpdaterǁupdate_sell_in__mutmut_orig)
     xǁNormalItemUpdaterǁupdate_sell_in__mutmut_orig.__name__ = 'xǁNormalItemUpdaterǁupdate_sell_in'
+    update_sell_in = _mutmut_bind('xǁNormalItemUpdaterǁupdate_sell_in', xǁNormalItemUpdaterǁupdate_sell_in__mutmut_orig, xǁNormalItemUpdaterǁupdate_sell_in__mutmut_mutants, update_sell_in)
     
     def xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_orig(self, item: Item) -> None:
         """Quality decreases by 1 before sell_in date."""
@@ -294,19 +371,18 @@ class NormalItemUpdater(QualityUpdater):
         """Quality decreases by 1 before sell_in date."""
         item.quality = self.clamp_quality(item.quality - 2)
     
-    xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_1': xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_1, 
-        'xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_2': xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_2, 
-        'xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_3': xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_3, 
-        'xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_4': xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_4
-    }
+    xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_1', xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_1),
+        ('xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_2', xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_2),
+        ('xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_3', xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_3),
+        ('xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_4', xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_4),
+    )
     
-    def _degrade_quality_before_expiration(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_orig"), object.__getattribute__(self, "xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _degrade_quality_before_expiration = _mutmut_wrapper(xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_orig, xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_mutants)
     
     _degrade_quality_before_expiration.__signature__ = _mutmut_signature(xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_orig)
     xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_orig.__name__ = 'xǁNormalItemUpdaterǁ_degrade_quality_before_expiration'
+    _degrade_quality_before_expiration = _mutmut_bind('xǁNormalItemUpdaterǁ_degrade_quality_before_expiration', xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_orig, xǁNormalItemUpdaterǁ_degrade_quality_before_expiration__mutmut_mutants, _degrade_quality_before_expiration)
     
     def xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_orig(self, item: Item) -> None:
         """Quality degrades one more time after becoming expired."""
@@ -328,19 +404,18 @@ class NormalItemUpdater(QualityUpdater):
         """Quality degrades one more time after becoming expired."""
         item.quality = self.clamp_quality(item.quality - 2)
     
-    xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_1': xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_1, 
-        'xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_2': xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_2, 
-        'xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_3': xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_3, 
-        'xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_4': xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_4
-    }
+    xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_1', xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_1),
+        ('xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_2', xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_2),
+        ('xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_3', xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_3),
+        ('xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_4', xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_4),
+    )
     
-    def _degrade_quality_additional_after_expiration(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_orig"), object.__getattribute__(self, "xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _degrade_quality_additional_after_expiration = _mutmut_wrapper(xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_orig, xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_mutants)
     
     _degrade_quality_additional_after_expiration.__signature__ = _mutmut_signature(xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_orig)
     xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_orig.__name__ = 'xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration'
+    _degrade_quality_additional_after_expiration = _mutmut_bind('xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration', xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_orig, xǁNormalItemUpdaterǁ_degrade_quality_additional_after_expiration__mutmut_mutants, _degrade_quality_additional_after_expiration)
 
 
 class AgedBrieUpdater(QualityUpdater):
@@ -357,16 +432,15 @@ class AgedBrieUpdater(QualityUpdater):
         """Increase quality by 1 before expiration, 2 after."""
         self._improve_quality_before_expiration(None)
     
-    xǁAgedBrieUpdaterǁupdate_quality__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁAgedBrieUpdaterǁupdate_quality__mutmut_1': xǁAgedBrieUpdaterǁupdate_quality__mutmut_1
-    }
+    xǁAgedBrieUpdaterǁupdate_quality__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁAgedBrieUpdaterǁupdate_quality__mutmut_1', xǁAgedBrieUpdaterǁupdate_quality__mutmut_1),
+    )
     
-    def update_quality(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁAgedBrieUpdaterǁupdate_quality__mutmut_orig"), object.__getattribute__(self, "xǁAgedBrieUpdaterǁupdate_quality__mutmut_mutants"), args, kwargs, self)
-        return result 
+    update_quality = _mutmut_wrapper(xǁAgedBrieUpdaterǁupdate_quality__mutmut_orig, xǁAgedBrieUpdaterǁupdate_quality__mutmut_mutants)
     
     update_quality.__signature__ = _mutmut_signature(xǁAgedBrieUpdaterǁupdate_quality__mutmut_orig)
     xǁAgedBrieUpdaterǁupdate_quality__mutmut_orig.__name__ = 'xǁAgedBrieUpdaterǁupdate_quality'
+    update_quality = _mutmut_bind('xǁAgedBrieUpdaterǁupdate_quality', xǁAgedBrieUpdaterǁupdate_quality__mutmut_orig, xǁAgedBrieUpdaterǁupdate_quality__mutmut_mutants, update_quality)
     
     def xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_orig(self, item: Item) -> None:
         """Decrease sell_in by 1 each day."""
@@ -396,18 +470,17 @@ class AgedBrieUpdater(QualityUpdater):
         if self.is_expired(item):
             self._improve_quality_additional_after_expiration(None)
     
-    xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_1': xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_1, 
-        'xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_2': xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_2, 
-        'xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_3': xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_3
-    }
+    xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_1', xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_1),
+        ('xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_2', xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_2),
+        ('xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_3', xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_3),
+    )
     
-    def update_sell_in(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_orig"), object.__getattribute__(self, "xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_mutants"), args, kwargs, self)
-        return result 
+    update_sell_in = _mutmut_wrapper(xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_orig, xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_mutants)
     
     update_sell_in.__signature__ = _mutmut_signature(xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_orig)
     xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_orig.__name__ = 'xǁAgedBrieUpdaterǁupdate_sell_in'
+    update_sell_in = _mutmut_bind('xǁAgedBrieUpdaterǁupdate_sell_in', xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_orig, xǁAgedBrieUpdaterǁupdate_sell_in__mutmut_mutants, update_sell_in)
     
     def xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_orig(self, item: Item) -> None:
         """Quality increases by 1 before sell_in date."""
@@ -429,19 +502,18 @@ class AgedBrieUpdater(QualityUpdater):
         """Quality increases by 1 before sell_in date."""
         item.quality = self.clamp_quality(item.quality + 2)
     
-    xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_1': xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_1, 
-        'xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_2': xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_2, 
-        'xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_3': xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_3, 
-        'xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_4': xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_4
-    }
+    xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_1', xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_1),
+        ('xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_2', xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_2),
+        ('xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_3', xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_3),
+        ('xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_4', xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_4),
+    )
     
-    def _improve_quality_before_expiration(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_orig"), object.__getattribute__(self, "xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _improve_quality_before_expiration = _mutmut_wrapper(xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_orig, xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_mutants)
     
     _improve_quality_before_expiration.__signature__ = _mutmut_signature(xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_orig)
     xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_orig.__name__ = 'xǁAgedBrieUpdaterǁ_improve_quality_before_expiration'
+    _improve_quality_before_expiration = _mutmut_bind('xǁAgedBrieUpdaterǁ_improve_quality_before_expiration', xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_orig, xǁAgedBrieUpdaterǁ_improve_quality_before_expiration__mutmut_mutants, _improve_quality_before_expiration)
     
     def xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_orig(self, item: Item) -> None:
         """Quality improves one more time after becoming expired."""
@@ -463,19 +535,18 @@ class AgedBrieUpdater(QualityUpdater):
         """Quality improves one more time after becoming expired."""
         item.quality = self.clamp_quality(item.quality + 2)
     
-    xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_1': xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_1, 
-        'xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_2': xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_2, 
-        'xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_3': xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_3, 
-        'xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_4': xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_4
-    }
+    xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_1', xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_1),
+        ('xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_2', xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_2),
+        ('xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_3', xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_3),
+        ('xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_4', xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_4),
+    )
     
-    def _improve_quality_additional_after_expiration(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_orig"), object.__getattribute__(self, "xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _improve_quality_additional_after_expiration = _mutmut_wrapper(xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_orig, xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_mutants)
     
     _improve_quality_additional_after_expiration.__signature__ = _mutmut_signature(xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_orig)
     xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_orig.__name__ = 'xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration'
+    _improve_quality_additional_after_expiration = _mutmut_bind('xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration', xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_orig, xǁAgedBrieUpdaterǁ_improve_quality_additional_after_expiration__mutmut_mutants, _improve_quality_additional_after_expiration)
 
 
 class BackstagePassUpdater(QualityUpdater):
@@ -495,16 +566,15 @@ class BackstagePassUpdater(QualityUpdater):
         """Increase quality based on urgency (days until concert)."""
         self._increase_quality_by_urgency(None)
     
-    xǁBackstagePassUpdaterǁupdate_quality__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁBackstagePassUpdaterǁupdate_quality__mutmut_1': xǁBackstagePassUpdaterǁupdate_quality__mutmut_1
-    }
+    xǁBackstagePassUpdaterǁupdate_quality__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁBackstagePassUpdaterǁupdate_quality__mutmut_1', xǁBackstagePassUpdaterǁupdate_quality__mutmut_1),
+    )
     
-    def update_quality(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁBackstagePassUpdaterǁupdate_quality__mutmut_orig"), object.__getattribute__(self, "xǁBackstagePassUpdaterǁupdate_quality__mutmut_mutants"), args, kwargs, self)
-        return result 
+    update_quality = _mutmut_wrapper(xǁBackstagePassUpdaterǁupdate_quality__mutmut_orig, xǁBackstagePassUpdaterǁupdate_quality__mutmut_mutants)
     
     update_quality.__signature__ = _mutmut_signature(xǁBackstagePassUpdaterǁupdate_quality__mutmut_orig)
     xǁBackstagePassUpdaterǁupdate_quality__mutmut_orig.__name__ = 'xǁBackstagePassUpdaterǁupdate_quality'
+    update_quality = _mutmut_bind('xǁBackstagePassUpdaterǁupdate_quality', xǁBackstagePassUpdaterǁupdate_quality__mutmut_orig, xǁBackstagePassUpdaterǁupdate_quality__mutmut_mutants, update_quality)
     
     def xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_orig(self, item: Item) -> None:
         """Decrease sell_in by 1 each day."""
@@ -534,18 +604,17 @@ class BackstagePassUpdater(QualityUpdater):
         if self.is_expired(item):
             self._expire_backstage_pass(None)
     
-    xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_1': xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_1, 
-        'xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_2': xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_2, 
-        'xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_3': xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_3
-    }
+    xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_1', xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_1),
+        ('xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_2', xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_2),
+        ('xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_3', xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_3),
+    )
     
-    def update_sell_in(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_orig"), object.__getattribute__(self, "xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_mutants"), args, kwargs, self)
-        return result 
+    update_sell_in = _mutmut_wrapper(xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_orig, xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_mutants)
     
     update_sell_in.__signature__ = _mutmut_signature(xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_orig)
     xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_orig.__name__ = 'xǁBackstagePassUpdaterǁupdate_sell_in'
+    update_sell_in = _mutmut_bind('xǁBackstagePassUpdaterǁupdate_sell_in', xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_orig, xǁBackstagePassUpdaterǁupdate_sell_in__mutmut_mutants, update_sell_in)
     
     def xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_orig(self, item: Item) -> None:
         """Increase quality based on days until concert (tiered bonuses)."""
@@ -577,20 +646,19 @@ class BackstagePassUpdater(QualityUpdater):
         quality_increase = self._calculate_quality_increase(item.sell_in)
         item.quality = self.clamp_quality(item.quality - quality_increase)
     
-    xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_1': xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_1, 
-        'xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_2': xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_2, 
-        'xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_3': xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_3, 
-        'xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_4': xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_4, 
-        'xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_5': xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_5
-    }
+    xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_1', xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_1),
+        ('xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_2', xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_2),
+        ('xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_3', xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_3),
+        ('xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_4', xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_4),
+        ('xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_5', xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_5),
+    )
     
-    def _increase_quality_by_urgency(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_orig"), object.__getattribute__(self, "xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _increase_quality_by_urgency = _mutmut_wrapper(xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_orig, xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_mutants)
     
     _increase_quality_by_urgency.__signature__ = _mutmut_signature(xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_orig)
     xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_orig.__name__ = 'xǁBackstagePassUpdaterǁ_increase_quality_by_urgency'
+    _increase_quality_by_urgency = _mutmut_bind('xǁBackstagePassUpdaterǁ_increase_quality_by_urgency', xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_orig, xǁBackstagePassUpdaterǁ_increase_quality_by_urgency__mutmut_mutants, _increase_quality_by_urgency)
     
     def xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_orig(self, days_until_concert: int) -> int:
         """
@@ -664,20 +732,19 @@ class BackstagePassUpdater(QualityUpdater):
         else:
             return 2  # More than 10 days: increase by 1
     
-    xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_1': xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_1, 
-        'xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_2': xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_2, 
-        'xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_3': xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_3, 
-        'xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_4': xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_4, 
-        'xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_5': xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_5
-    }
+    xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_1', xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_1),
+        ('xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_2', xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_2),
+        ('xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_3', xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_3),
+        ('xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_4', xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_4),
+        ('xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_5', xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_5),
+    )
     
-    def _calculate_quality_increase(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_orig"), object.__getattribute__(self, "xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _calculate_quality_increase = _mutmut_wrapper(xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_orig, xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_mutants)
     
     _calculate_quality_increase.__signature__ = _mutmut_signature(xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_orig)
     xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_orig.__name__ = 'xǁBackstagePassUpdaterǁ_calculate_quality_increase'
+    _calculate_quality_increase = _mutmut_bind('xǁBackstagePassUpdaterǁ_calculate_quality_increase', xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_orig, xǁBackstagePassUpdaterǁ_calculate_quality_increase__mutmut_mutants, _calculate_quality_increase)
     
     def xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_orig(self, item: Item) -> None:
         """Backstage pass loses all value after concert."""
@@ -687,16 +754,15 @@ class BackstagePassUpdater(QualityUpdater):
         """Backstage pass loses all value after concert."""
         item.quality = None
     
-    xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_1': xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_1
-    }
+    xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_1', xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_1),
+    )
     
-    def _expire_backstage_pass(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_orig"), object.__getattribute__(self, "xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _expire_backstage_pass = _mutmut_wrapper(xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_orig, xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_mutants)
     
     _expire_backstage_pass.__signature__ = _mutmut_signature(xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_orig)
     xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_orig.__name__ = 'xǁBackstagePassUpdaterǁ_expire_backstage_pass'
+    _expire_backstage_pass = _mutmut_bind('xǁBackstagePassUpdaterǁ_expire_backstage_pass', xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_orig, xǁBackstagePassUpdaterǁ_expire_backstage_pass__mutmut_mutants, _expire_backstage_pass)
 
 
 class SulfurasUpdater(QualityUpdater):
@@ -714,6 +780,13 @@ class SulfurasUpdater(QualityUpdater):
         pass  # No operation - immutable
 
 
+# Strategies hold no state, so one shared instance of each is enough
+NORMAL_UPDATER = NormalItemUpdater()
+BRIE_UPDATER = AgedBrieUpdater()
+BACKSTAGE_UPDATER = BackstagePassUpdater()
+SULFURAS_UPDATER = SulfurasUpdater()
+
+
 class ItemUpdaterFactory:
     """
     Factory Pattern for creating strategies.
@@ -805,32 +878,31 @@ class ItemUpdaterFactory:
             "SULFURAS, HAND OF RAGNAROS": SulfurasUpdater(),
         }
     
-    xǁItemUpdaterFactoryǁ__init____mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁItemUpdaterFactoryǁ__init____mutmut_1': xǁItemUpdaterFactoryǁ__init____mutmut_1, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_2': xǁItemUpdaterFactoryǁ__init____mutmut_2, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_3': xǁItemUpdaterFactoryǁ__init____mutmut_3, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_4': xǁItemUpdaterFactoryǁ__init____mutmut_4, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_5': xǁItemUpdaterFactoryǁ__init____mutmut_5, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_6': xǁItemUpdaterFactoryǁ__init____mutmut_6, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_7': xǁItemUpdaterFactoryǁ__init____mutmut_7, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_8': xǁItemUpdaterFactoryǁ__init____mutmut_8, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_9': xǁItemUpdaterFactoryǁ__init____mutmut_9, 
-        'xǁItemUpdaterFactoryǁ__init____mutmut_10': xǁItemUpdaterFactoryǁ__init____mutmut_10
-    }
-    
-    def __init__(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁItemUpdaterFactoryǁ__init____mutmut_orig"), object.__getattribute__(self, "xǁItemUpdaterFactoryǁ__init____mutmut_mutants"), args, kwargs, self)
-        return result 
+    xǁItemUpdaterFactoryǁ__init____mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_1', xǁItemUpdaterFactoryǁ__init____mutmut_1),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_2', xǁItemUpdaterFactoryǁ__init____mutmut_2),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_3', xǁItemUpdaterFactoryǁ__init____mutmut_3),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_4', xǁItemUpdaterFactoryǁ__init____mutmut_4),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_5', xǁItemUpdaterFactoryǁ__init____mutmut_5),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_6', xǁItemUpdaterFactoryǁ__init____mutmut_6),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_7', xǁItemUpdaterFactoryǁ__init____mutmut_7),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_8', xǁItemUpdaterFactoryǁ__init____mutmut_8),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_9', xǁItemUpdaterFactoryǁ__init____mutmut_9),
+        ('xǁItemUpdaterFactoryǁ__init____mutmut_10', xǁItemUpdaterFactoryǁ__init____mutmut_10),
+    )
+    
+    __init__ = _mutmut_wrapper(xǁItemUpdaterFactoryǁ__init____mutmut_orig, xǁItemUpdaterFactoryǁ__init____mutmut_mutants)
     
     __init__.__signature__ = _mutmut_signature(xǁItemUpdaterFactoryǁ__init____mutmut_orig)
     xǁItemUpdaterFactoryǁ__init____mutmut_orig.__name__ = 'xǁItemUpdaterFactoryǁ__init__'
+    __init__ = _mutmut_bind('xǁItemUpdaterFactoryǁ__init__', xǁItemUpdaterFactoryǁ__init____mutmut_orig, xǁItemUpdaterFactoryǁ__init____mutmut_mutants, __init__)
     
     def xǁItemUpdaterFactoryǁget_updater__mutmut_orig(self, item_name: str) -> QualityUpdater:
         """
         Get the appropriate strategy for an item.
         Returns NormalItemUpdater for unknown types (default).
         """
-        return self._strategies.get(item_name, NormalItemUpdater())
+        return self._strategies.get(item_name, NORMAL_UPDATER)
     
     def xǁItemUpdaterFactoryǁget_updater__mutmut_1(self, item_name: str) -> QualityUpdater:
         """
@@ -860,19 +932,18 @@ class ItemUpdaterFactory:
         """
         return self._strategies.get(item_name, )
     
-    xǁItemUpdaterFactoryǁget_updater__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁItemUpdaterFactoryǁget_updater__mutmut_1': xǁItemUpdaterFactoryǁget_updater__mutmut_1, 
-        'xǁItemUpdaterFactoryǁget_updater__mutmut_2': xǁItemUpdaterFactoryǁget_updater__mutmut_2, 
-        'xǁItemUpdaterFactoryǁget_updater__mutmut_3': xǁItemUpdaterFactoryǁget_updater__mutmut_3, 
-        'xǁItemUpdaterFactoryǁget_updater__mutmut_4': xǁItemUpdaterFactoryǁget_updater__mutmut_4
-    }
+    xǁItemUpdaterFactoryǁget_updater__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁItemUpdaterFactoryǁget_updater__mutmut_1', xǁItemUpdaterFactoryǁget_updater__mutmut_1),
+        ('xǁItemUpdaterFactoryǁget_updater__mutmut_2', xǁItemUpdaterFactoryǁget_updater__mutmut_2),
+        ('xǁItemUpdaterFactoryǁget_updater__mutmut_3', xǁItemUpdaterFactoryǁget_updater__mutmut_3),
+        ('xǁItemUpdaterFactoryǁget_updater__mutmut_4', xǁItemUpdaterFactoryǁget_updater__mutmut_4),
+    )
     
-    def get_updater(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁItemUpdaterFactoryǁget_updater__mutmut_orig"), object.__getattribute__(self, "xǁItemUpdaterFactoryǁget_updater__mutmut_mutants"), args, kwargs, self)
-        return result 
+    get_updater = _mutmut_wrapper(xǁItemUpdaterFactoryǁget_updater__mutmut_orig, xǁItemUpdaterFactoryǁget_updater__mutmut_mutants)
     
     get_updater.__signature__ = _mutmut_signature(xǁItemUpdaterFactoryǁget_updater__mutmut_orig)
     xǁItemUpdaterFactoryǁget_updater__mutmut_orig.__name__ = 'xǁItemUpdaterFactoryǁget_updater'
+    get_updater = _mutmut_bind('xǁItemUpdaterFactoryǁget_updater', xǁItemUpdaterFactoryǁget_updater__mutmut_orig, xǁItemUpdaterFactoryǁget_updater__mutmut_mutants, get_updater)
     
     def xǁItemUpdaterFactoryǁregister_strategy__mutmut_orig(self, item_name: str, updater: QualityUpdater) -> None:
         """
@@ -888,16 +959,15 @@ class ItemUpdaterFactory:
         """
         self._strategies[item_name] = None
     
-    xǁItemUpdaterFactoryǁregister_strategy__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁItemUpdaterFactoryǁregister_strategy__mutmut_1': xǁItemUpdaterFactoryǁregister_strategy__mutmut_1
-    }
+    xǁItemUpdaterFactoryǁregister_strategy__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁItemUpdaterFactoryǁregister_strategy__mutmut_1', xǁItemUpdaterFactoryǁregister_strategy__mutmut_1),
+    )
     
-    def register_strategy(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁItemUpdaterFactoryǁregister_strategy__mutmut_orig"), object.__getattribute__(self, "xǁItemUpdaterFactoryǁregister_strategy__mutmut_mutants"), args, kwargs, self)
-        return result 
+    register_strategy = _mutmut_wrapper(xǁItemUpdaterFactoryǁregister_strategy__mutmut_orig, xǁItemUpdaterFactoryǁregister_strategy__mutmut_mutants)
     
     register_strategy.__signature__ = _mutmut_signature(xǁItemUpdaterFactoryǁregister_strategy__mutmut_orig)
     xǁItemUpdaterFactoryǁregister_strategy__mutmut_orig.__name__ = 'xǁItemUpdaterFactoryǁregister_strategy'
+    register_strategy = _mutmut_bind('xǁItemUpdaterFactoryǁregister_strategy', xǁItemUpdaterFactoryǁregister_strategy__mutmut_orig, xǁItemUpdaterFactoryǁregister_strategy__mutmut_mutants, register_strategy)
 
 
 class GildedRose:
@@ -925,17 +995,16 @@ class GildedRose:
         self.items = items
         self._updater_factory = None
     
-    xǁGildedRoseǁ__init____mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁGildedRoseǁ__init____mutmut_1': xǁGildedRoseǁ__init____mutmut_1, 
-        'xǁGildedRoseǁ__init____mutmut_2': xǁGildedRoseǁ__init____mutmut_2
-    }
+    xǁGildedRoseǁ__init____mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁGildedRoseǁ__init____mutmut_1', xǁGildedRoseǁ__init____mutmut_1),
+        ('xǁGildedRoseǁ__init____mutmut_2', xǁGildedRoseǁ__init____mutmut_2),
+    )
     
-    def __init__(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁGildedRoseǁ__init____mutmut_orig"), object.__getattribute__(self, "xǁGildedRoseǁ__init____mutmut_mutants"), args, kwargs, self)
-        return result 
+    __init__ = _mutmut_wrapper(xǁGildedRoseǁ__init____mutmut_orig, xǁGildedRoseǁ__init____mutmut_mutants)
     
     __init__.__signature__ = _mutmut_signature(xǁGildedRoseǁ__init____mutmut_orig)
     xǁGildedRoseǁ__init____mutmut_orig.__name__ = 'xǁGildedRoseǁ__init__'
+    __init__ = _mutmut_bind('xǁGildedRoseǁ__init__', xǁGildedRoseǁ__init____mutmut_orig, xǁGildedRoseǁ__init____mutmut_mutants, __init__)
     
     def xǁGildedRoseǁupdate_quality__mutmut_orig(self) -> None:
         """Update quality for all items in inventory."""
@@ -947,16 +1016,15 @@ class GildedRose:
         for item in self.items:
             self._update_single_item(None)
     
-    xǁGildedRoseǁupdate_quality__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁGildedRoseǁupdate_quality__mutmut_1': xǁGildedRoseǁupdate_quality__mutmut_1
-    }
+    xǁGildedRoseǁupdate_quality__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁGildedRoseǁupdate_quality__mutmut_1', xǁGildedRoseǁupdate_quality__mutmut_1),
+    )
     
-    def update_quality(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁGildedRoseǁupdate_quality__mutmut_orig"), object.__getattribute__(self, "xǁGildedRoseǁupdate_quality__mutmut_mutants"), args, kwargs, self)
-        return result 
+    update_quality = _mutmut_wrapper(xǁGildedRoseǁupdate_quality__mutmut_orig, xǁGildedRoseǁupdate_quality__mutmut_mutants)
     
     update_quality.__signature__ = _mutmut_signature(xǁGildedRoseǁupdate_quality__mutmut_orig)
     xǁGildedRoseǁupdate_quality__mutmut_orig.__name__ = 'xǁGildedRoseǁupdate_quality'
+    update_quality = _mutmut_bind('xǁGildedRoseǁupdate_quality', xǁGildedRoseǁupdate_quality__mutmut_orig, xǁGildedRoseǁupdate_quality__mutmut_mutants, update_quality)
     
     def xǁGildedRoseǁ_update_single_item__mutmut_orig(self, item: Item) -> None:
         """
@@ -1008,16 +1076,22 @@ class GildedRose:
         updater.update_quality(item)
         updater.update_sell_in(None)
     
-    xǁGildedRoseǁ_update_single_item__mutmut_mutants : ClassVar[MutantDict] = {
-    'xǁGildedRoseǁ_update_single_item__mutmut_1': xǁGildedRoseǁ_update_single_item__mutmut_1, 
-        'xǁGildedRoseǁ_update_single_item__mutmut_2': xǁGildedRoseǁ_update_single_item__mutmut_2, 
-        'xǁGildedRoseǁ_update_single_item__mutmut_3': xǁGildedRoseǁ_update_single_item__mutmut_3, 
-        'xǁGildedRoseǁ_update_single_item__mutmut_4': xǁGildedRoseǁ_update_single_item__mutmut_4
-    }
+    xǁGildedRoseǁ_update_single_item__mutmut_mutants : ClassVar[MutantTable] = (
+        ('xǁGildedRoseǁ_update_single_item__mutmut_1', xǁGildedRoseǁ_update_single_item__mutmut_1),
+        ('xǁGildedRoseǁ_update_single_item__mutmut_2', xǁGildedRoseǁ_update_single_item__mutmut_2),
+        ('xǁGildedRoseǁ_update_single_item__mutmut_3', xǁGildedRoseǁ_update_single_item__mutmut_3),
+        ('xǁGildedRoseǁ_update_single_item__mutmut_4', xǁGildedRoseǁ_update_single_item__mutmut_4),
+    )
     
-    def _update_single_item(self, *args, **kwargs):
-        result = _mutmut_trampoline(object.__getattribute__(self, "xǁGildedRoseǁ_update_single_item__mutmut_orig"), object.__getattribute__(self, "xǁGildedRoseǁ_update_single_item__mutmut_mutants"), args, kwargs, self)
-        return result 
+    _update_single_item = _mutmut_wrapper(xǁGildedRoseǁ_update_single_item__mutmut_orig, xǁGildedRoseǁ_update_single_item__mutmut_mutants)
     
     _update_single_item.__signature__ = _mutmut_signature(xǁGildedRoseǁ_update_single_item__mutmut_orig)
     xǁGildedRoseǁ_update_single_item__mutmut_orig.__name__ = 'xǁGildedRoseǁ_update_single_item'
+    _update_single_item = _mutmut_bind('xǁGildedRoseǁ_update_single_item', xǁGildedRoseǁ_update_single_item__mutmut_orig, xǁGildedRoseǁ_update_single_item__mutmut_mutants, _update_single_item)
+
+
+if _RELEASE:
+    for _cls in (Item, QualityUpdater, NormalItemUpdater, AgedBrieUpdater, BackstagePassUpdater, SulfurasUpdater, ItemUpdaterFactory, GildedRose):
+        for _attr in [attr for attr in vars(_cls) if attr.startswith('xǁ')]:
+            delattr(_cls, _attr)
+    del _cls, _attr
@@ -1,3 +1,5 @@
+import os
+import sys
 from inspect import signature as _mutmut_signature
 from typing import Annotated
 from typing import Callable
@@ -29,4 +31,20 @@ def _mutmut_trampoline(orig, mutants, call_args, call_kwargs, self_arg = None):
         result = mutants[mutant_name](self_arg, *call_args, **call_kwargs)
     else:
         result = mutants[mutant_name](*call_args, **call_kwargs)
-    return result
\ No newline at end of file
+    return result
+
+
+def pytest_sessionstart(session):
+    """Let already imported instrumented modules see the current MUTANT_UNDER_TEST"""
+    # mutmut sets it after import: in-process for its clean and 'fail' runs,
+    # and in every forked mutant child
+    source_module = sys.modules.get('gilded_rose')
+    if source_module is not None:
+        source_module._refresh_mutant_env()
+    # .mutmut-config.py has no importable name, so look it up by its file
+    for module in list(sys.modules.values()):
+        if os.path.basename(getattr(module, '__file__', None) or '') == '.mutmut-config.py':
+            module._refresh_mutant_env()
+    test_module = sys.modules.get('tests.test_gilded_rose')
+    if test_module is not None:
+        test_module.invalidate_mutant_cache()
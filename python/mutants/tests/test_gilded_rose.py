@@ -1,40 +1,106 @@
 # -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+import sys
 import pytest
 from gilded_rose import Item, GildedRose
 from inspect import signature as _mutmut_signature
-from typing import Annotated
-from typing import Callable
-from typing import ClassVar
 
+# Same meaning as typing.TYPE_CHECKING without importing typing at runtime.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    # Only static checkers read these; annotations are not evaluated at runtime.
+    from typing import Annotated
+    from typing import Callable
+    from typing import ClassVar
+
+    MutantDict = Annotated[dict[str, Callable], "Mutant"]
+
+# Read once per test session. mutmut changes the variable between its
+# in-process runs and in forked children, so conftest.py's
+# pytest_sessionstart() calls invalidate_mutant_cache() before every session.
+# Both strings are interned, as in .mutmut-config.py.
+_MUTANT_UNDER_TEST = sys.intern(os.environ.get('MUTANT_UNDER_TEST', ''))
+# The mutant's key in a MutantDict: MUTANT_UNDER_TEST without its module
+_MUTANT_KEY = sys.intern(_MUTANT_UNDER_TEST.rpartition('.')[-1])
 
-MutantDict = Annotated[dict[str, Callable], "Mutant"]
+
+def invalidate_mutant_cache():
+    """Re-read MUTANT_UNDER_TEST after it was changed in-process"""
+    global _MUTANT_UNDER_TEST, _MUTANT_KEY
+    _MUTANT_UNDER_TEST = sys.intern(os.environ.get('MUTANT_UNDER_TEST', ''))
+    _MUTANT_KEY = sys.intern(_MUTANT_UNDER_TEST.rpartition('.')[-1])
+    _mutmut_rebind()
+
+
+# orig.__name__ -> the MUTANT_UNDER_TEST prefix of that function's mutants
+_MUTMUT_PREFIXES = {}
 
 
 def _mutmut_trampoline(orig, mutants, call_args, call_kwargs, self_arg = None):
     """Forward call to original or mutated function, depending on the environment"""
-    import os
-    mutant_under_test = os.environ['MUTANT_UNDER_TEST']
+    mutant_under_test = _MUTANT_UNDER_TEST
+    if not mutant_under_test:
+        # No mutant enabled: a plain test run
+        return orig(*call_args, **call_kwargs)
     if mutant_under_test == 'fail':
         from mutmut.__main__ import MutmutProgrammaticFailException
         raise MutmutProgrammaticFailException('Failed programmatically')      
     elif mutant_under_test == 'stats':
         from mutmut.__main__ import record_trampoline_hit
-        record_trampoline_hit(orig.__module__ + '.' + orig.__name__)
+        record_trampoline_hit(orig._mutmut_fqn)
         result = orig(*call_args, **call_kwargs)
         return result
-    prefix = orig.__module__ + '.' + orig.__name__ + '__mutmut_'
+    name = orig.__name__
+    prefix = _MUTMUT_PREFIXES.get(name)
+    if prefix is None:
+        prefix = _MUTMUT_PREFIXES[name] = orig.__module__ + '.' + name + '__mutmut_'
     if not mutant_under_test.startswith(prefix):
         result = orig(*call_args, **call_kwargs)
         return result
-    mutant_name = mutant_under_test.rpartition('.')[-1]
+    mutant = mutants[_MUTANT_KEY]
     if self_arg is not None:
         # call to a class method where self is not bound
-        result = mutants[mutant_name](self_arg, *call_args, **call_kwargs)
+        result = mutant(self_arg, *call_args, **call_kwargs)
     else:
-        result = mutants[mutant_name](*call_args, **call_kwargs)
+        result = mutant(*call_args, **call_kwargs)
     return result
 
 
+# (orig, mutants, trampolined) of every test bound by _mutmut_bind, for
+# _mutmut_rebind
+_MUTMUT_TESTS = []
+
+
+def _mutmut_choose(orig, mutants, trampolined):
+    """Return what a wrapped test runs for the cached MUTANT_UNDER_TEST"""
+    if not _MUTANT_UNDER_TEST:
+        return orig
+    if _MUTANT_UNDER_TEST in ('fail', 'stats'):
+        # mutmut's own bookkeeping runs keep going through the trampoline
+        return trampolined
+    if not _MUTANT_UNDER_TEST.startswith(orig.__module__ + '.' + orig.__name__ + '__mutmut_'):
+        return orig
+    return mutants[_MUTANT_KEY]
+
+
+def _mutmut_bind(orig, mutants, trampolined):
+    """Pick, at class creation, what a wrapped test name is bound to"""
+    # The name mutmut's stats run records for the test
+    orig._mutmut_fqn = orig.__module__ + '.' + orig.__name__
+    _MUTMUT_TESTS.append((orig, mutants, trampolined))
+    return _mutmut_choose(orig, mutants, trampolined)
+
+
+def _mutmut_rebind():
+    """Bind every wrapped test to what it runs for the cached MUTANT_UNDER_TEST"""
+    for orig, mutants, trampolined in _MUTMUT_TESTS:
+        _, class_name, method_name = orig.__name__.split('ǁ')
+        setattr(globals()[class_name], method_name, _mutmut_choose(orig, mutants, trampolined))
+
+
 class TestGildedRoseNormalItems:
     """Tests for normal items (neither Aged Brie nor Backstage passes)."""
 
@@ -1762,6 +1828,7 @@ class TestGildedRoseMultipleItems:
     
     test_multiple_items_update_independently.__signature__ = _mutmut_signature(xǁTestGildedRoseMultipleItemsǁtest_multiple_items_update_independently__mutmut_orig)
     xǁTestGildedRoseMultipleItemsǁtest_multiple_items_update_independently__mutmut_orig.__name__ = 'xǁTestGildedRoseMultipleItemsǁtest_multiple_items_update_independently'
+    test_multiple_items_update_independently = _mutmut_bind(xǁTestGildedRoseMultipleItemsǁtest_multiple_items_update_independently__mutmut_orig, xǁTestGildedRoseMultipleItemsǁtest_multiple_items_update_independently__mutmut_mutants, test_multiple_items_update_independently)
 
     def xǁTestGildedRoseMultipleItemsǁtest_empty_item_list__mutmut_orig(self):
         """Empty item list should not raise an error."""
@@ -1825,6 +1892,7 @@ class TestGildedRoseMultipleItems:
     
     test_empty_item_list.__signature__ = _mutmut_signature(xǁTestGildedRoseMultipleItemsǁtest_empty_item_list__mutmut_orig)
     xǁTestGildedRoseMultipleItemsǁtest_empty_item_list__mutmut_orig.__name__ = 'xǁTestGildedRoseMultipleItemsǁtest_empty_item_list'
+    test_empty_item_list = _mutmut_bind(xǁTestGildedRoseMultipleItemsǁtest_empty_item_list__mutmut_orig, xǁTestGildedRoseMultipleItemsǁtest_empty_item_list__mutmut_mutants, test_empty_item_list)
 
 
 class TestGildedRoseEdgeCasesAndBoundaries:
@@ -2038,6 +2106,7 @@ class TestGildedRoseEdgeCasesAndBoundaries:
     
     test_normal_item_quality_never_negative.__signature__ = _mutmut_signature(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_normal_item_quality_never_negative__mutmut_orig)
     xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_normal_item_quality_never_negative__mutmut_orig.__name__ = 'xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_normal_item_quality_never_negative'
+    test_normal_item_quality_never_negative = _mutmut_bind(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_normal_item_quality_never_negative__mutmut_orig, xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_normal_item_quality_never_negative__mutmut_mutants, test_normal_item_quality_never_negative)
 
     def xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_aged_brie_quality_never_above_50__mutmut_orig(self):
         """Quality of Aged Brie should never exceed 50."""
@@ -2247,6 +2316,7 @@ class TestGildedRoseEdgeCasesAndBoundaries:
     
     test_aged_brie_quality_never_above_50.__signature__ = _mutmut_signature(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_aged_brie_quality_never_above_50__mutmut_orig)
     xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_aged_brie_quality_never_above_50__mutmut_orig.__name__ = 'xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_aged_brie_quality_never_above_50'
+    test_aged_brie_quality_never_above_50 = _mutmut_bind(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_aged_brie_quality_never_above_50__mutmut_orig, xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_aged_brie_quality_never_above_50__mutmut_mutants, test_aged_brie_quality_never_above_50)
 
     def xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_quality_never_above_50__mutmut_orig(self):
         """Quality of Backstage passes should never exceed 50."""
@@ -2456,6 +2526,7 @@ class TestGildedRoseEdgeCasesAndBoundaries:
     
     test_backstage_pass_quality_never_above_50.__signature__ = _mutmut_signature(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_quality_never_above_50__mutmut_orig)
     xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_quality_never_above_50__mutmut_orig.__name__ = 'xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_quality_never_above_50'
+    test_backstage_pass_quality_never_above_50 = _mutmut_bind(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_quality_never_above_50__mutmut_orig, xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_quality_never_above_50__mutmut_mutants, test_backstage_pass_quality_never_above_50)
 
     def xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_drops_to_zero_immediately_after_concert__mutmut_orig(self):
         """Backstage pass quality becomes 0 the day after concert."""
@@ -2685,6 +2756,7 @@ class TestGildedRoseEdgeCasesAndBoundaries:
     
     test_backstage_pass_drops_to_zero_immediately_after_concert.__signature__ = _mutmut_signature(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_drops_to_zero_immediately_after_concert__mutmut_orig)
     xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_drops_to_zero_immediately_after_concert__mutmut_orig.__name__ = 'xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_drops_to_zero_immediately_after_concert'
+    test_backstage_pass_drops_to_zero_immediately_after_concert = _mutmut_bind(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_drops_to_zero_immediately_after_concert__mutmut_orig, xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_backstage_pass_drops_to_zero_immediately_after_concert__mutmut_mutants, test_backstage_pass_drops_to_zero_immediately_after_concert)
 
     @pytest.mark.parametrize("quality", [0, 1, 25, 49, 50])
     def test_normal_item_with_various_qualities(self, quality):
@@ -2822,6 +2894,7 @@ class TestGildedRoseEdgeCasesAndBoundaries:
     
     test_item_representation.__signature__ = _mutmut_signature(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_item_representation__mutmut_orig)
     xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_item_representation__mutmut_orig.__name__ = 'xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_item_representation'
+    test_item_representation = _mutmut_bind(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_item_representation__mutmut_orig, xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_item_representation__mutmut_mutants, test_item_representation)
 
     def xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_gilded_rose_initialization__mutmut_orig(self):
         """Test GildedRose initialization."""
@@ -2993,6 +3066,7 @@ class TestGildedRoseEdgeCasesAndBoundaries:
     
     test_gilded_rose_initialization.__signature__ = _mutmut_signature(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_gilded_rose_initialization__mutmut_orig)
     xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_gilded_rose_initialization__mutmut_orig.__name__ = 'xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_gilded_rose_initialization'
+    test_gilded_rose_initialization = _mutmut_bind(xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_gilded_rose_initialization__mutmut_orig, xǁTestGildedRoseEdgeCasesAndBoundariesǁtest_gilded_rose_initialization__mutmut_mutants, test_gilded_rose_initialization)
 
 
 class TestGildedRoseQualityCap:
@@ -3262,6 +3336,7 @@ class TestGildedRoseSellInBehavior:
     
     test_sulfuras_sell_in_never_decreases.__signature__ = _mutmut_signature(xǁTestGildedRoseSellInBehaviorǁtest_sulfuras_sell_in_never_decreases__mutmut_orig)
     xǁTestGildedRoseSellInBehaviorǁtest_sulfuras_sell_in_never_decreases__mutmut_orig.__name__ = 'xǁTestGildedRoseSellInBehaviorǁtest_sulfuras_sell_in_never_decreases'
+    test_sulfuras_sell_in_never_decreases = _mutmut_bind(xǁTestGildedRoseSellInBehaviorǁtest_sulfuras_sell_in_never_decreases__mutmut_orig, xǁTestGildedRoseSellInBehaviorǁtest_sulfuras_sell_in_never_decreases__mutmut_mutants, test_sulfuras_sell_in_never_decreases)
 
 
 class TestGildedRoseSequentialUpdates:
@@ -4315,6 +4390,7 @@ class TestGildedRoseSequentialUpdates:
     
     test_normal_item_over_multiple_days.__signature__ = _mutmut_signature(xǁTestGildedRoseSequentialUpdatesǁtest_normal_item_over_multiple_days__mutmut_orig)
     xǁTestGildedRoseSequentialUpdatesǁtest_normal_item_over_multiple_days__mutmut_orig.__name__ = 'xǁTestGildedRoseSequentialUpdatesǁtest_normal_item_over_multiple_days'
+    test_normal_item_over_multiple_days = _mutmut_bind(xǁTestGildedRoseSequentialUpdatesǁtest_normal_item_over_multiple_days__mutmut_orig, xǁTestGildedRoseSequentialUpdatesǁtest_normal_item_over_multiple_days__mutmut_mutants, test_normal_item_over_multiple_days)
 
     def xǁTestGildedRoseSequentialUpdatesǁtest_aged_brie_over_multiple_days__mutmut_orig(self):
         """Aged Brie should improve consistently over multiple days."""
@@ -5364,6 +5440,7 @@ class TestGildedRoseSequentialUpdates:
     
     test_aged_brie_over_multiple_days.__signature__ = _mutmut_signature(xǁTestGildedRoseSequentialUpdatesǁtest_aged_brie_over_multiple_days__mutmut_orig)
     xǁTestGildedRoseSequentialUpdatesǁtest_aged_brie_over_multiple_days__mutmut_orig.__name__ = 'xǁTestGildedRoseSequentialUpdatesǁtest_aged_brie_over_multiple_days'
+    test_aged_brie_over_multiple_days = _mutmut_bind(xǁTestGildedRoseSequentialUpdatesǁtest_aged_brie_over_multiple_days__mutmut_orig, xǁTestGildedRoseSequentialUpdatesǁtest_aged_brie_over_multiple_days__mutmut_mutants, test_aged_brie_over_multiple_days)
 
     def xǁTestGildedRoseSequentialUpdatesǁtest_backstage_pass_approaching_concert__mutmut_orig(self):
         """Backstage pass should improve at increasing rates as concert approaches."""
@@ -7088,6 +7165,7 @@ class TestGildedRoseSequentialUpdates:
     
     test_backstage_pass_approaching_concert.__signature__ = _mutmut_signature(xǁTestGildedRoseSequentialUpdatesǁtest_backstage_pass_approaching_concert__mutmut_orig)
     xǁTestGildedRoseSequentialUpdatesǁtest_backstage_pass_approaching_concert__mutmut_orig.__name__ = 'xǁTestGildedRoseSequentialUpdatesǁtest_backstage_pass_approaching_concert'
+    test_backstage_pass_approaching_concert = _mutmut_bind(xǁTestGildedRoseSequentialUpdatesǁtest_backstage_pass_approaching_concert__mutmut_orig, xǁTestGildedRoseSequentialUpdatesǁtest_backstage_pass_approaching_concert__mutmut_mutants, test_backstage_pass_approaching_concert)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,44 @@
 # -*- coding: utf-8 -*-
 import pytest
-from gilded_rose import Item, GildedRose
+import gilded_rose as gilded_rose_module
+from gilded_rose import (
+    AgedBrieUpdater,
+    BackstagePassUpdater,
+    GildedRose,
+    GildedRoseBatch,
+    Item,
+    ItemUpdaterFactory,
+    NormalItemUpdater,
+    QualityUpdater,
+    SulfurasUpdater,
+)
+
+
+ITEM_NAMES = [
+    "Normal Item",
+    "Aged Brie",
+    "Backstage passes to a TAFKAL80ETC concert",
+    "Sulfuras, Hand of Ragnaros",
+]
+
+
+def inventory(sell_in, quality):
+    """One item of every built-in kind, all from the same starting state."""
+    return [Item(name, sell_in, quality) for name in ITEM_NAMES]
+
+
+@pytest.fixture(params=["kernel", "numpy", "lists"])
+def batch_storage(request, monkeypatch):
+    """
+    Runs a GildedRoseBatch test through each update path: the _update_batch_jit
+    kernel, compiled or not, NumPy masks as without Numba, then plain lists.
+    """
+    if request.param == "lists":
+        monkeypatch.setattr(gilded_rose_module, "np", None)
+    else:
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(gilded_rose_module, "HAVE_NUMBA", request.param == "kernel")
+    return request.param
 
 
 class TestGildedRoseNormalItems:
@@ -235,6 +273,36 @@ class TestGildedRoseMultipleItems:
         assert items[3].quality == 80  # Sulfuras unchanged
         assert items[3].sell_in == 10
 
+    def test_items_with_same_name_update_independently(self):
+        """Items sharing a name share a strategy, not their state."""
+        items = [
+            Item("Backstage passes to a TAFKAL80ETC concert", 15, 20),
+            Item("Backstage passes to a TAFKAL80ETC concert", 10, 20),
+            Item("Backstage passes to a TAFKAL80ETC concert", 0, 20),
+        ]
+        gilded_rose = GildedRose(items)
+        gilded_rose.update_quality()
+
+        assert [item.quality for item in items] == [21, 22, 0]
+        assert [item.sell_in for item in items] == [14, 9, -1]
+
+    def test_registered_strategy_applies_from_next_update(self):
+        """update_quality picks up strategies registered between days."""
+        class FrozenUpdater(QualityUpdater):
+            def update_quality(self, item):
+                pass
+
+            def update_sell_in(self, item):
+                pass
+
+        items = [Item("Frozen", 3, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose.update_quality()
+        gilded_rose._updater_factory.register_strategy("Frozen", FrozenUpdater())
+        gilded_rose.update_quality()
+
+        assert (items[0].sell_in, items[0].quality) == (2, 9)
+
     def test_empty_item_list(self):
         """Empty item list should not raise an error."""
         items = []
@@ -308,6 +376,41 @@ class TestGildedRoseEdgeCasesAndBoundaries:
         item = Item("Test Item", 5, 25)
         assert repr(item) == "Test Item, 5, 25"
 
+    def test_item_uses_slots(self):
+        """Item keeps its fields in slots, without a per-instance __dict__."""
+        item = Item("Test Item", 5, 25)
+
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.price = 10
+
+    def test_item_names_are_interned(self):
+        """Equal item names built separately end up as the same string object."""
+        first = Item("".join(["Aged", " Brie"]), 5, 25)
+        second = Item("Aged Brie", 5, 25)
+
+        assert first.name is second.name
+
+    def test_default_updater_is_shared(self):
+        """Unknown names all get the same stateless NormalItemUpdater."""
+        factory = ItemUpdaterFactory()
+        updater = factory.get_updater("Unknown Item")
+
+        assert isinstance(updater, NormalItemUpdater)
+        assert factory.get_updater("Another Item") is updater
+        assert not hasattr(updater, "__dict__")
+
+    def test_factory_handler_follows_registration(self):
+        """get_handler() returns update_all, None for legendary items, and sees new strategies."""
+        factory = ItemUpdaterFactory()
+        handler = factory.get_handler("Aged Brie")
+        updater = AgedBrieUpdater()
+        factory.register_strategy("Aged Brie", updater)
+
+        assert handler == gilded_rose_module.BRIE_UPDATER.update_all
+        assert factory.get_handler("Sulfuras, Hand of Ragnaros") is None
+        assert factory.get_handler("Aged Brie") == updater.update_all
+
     def test_gilded_rose_initialization(self):
         """Test GildedRose initialization."""
         items = [Item("Test", 5, 25)]
@@ -474,5 +577,169 @@ class TestGildedRoseSequentialUpdates:
         assert items[0].sell_in == 4
 
 
+class TestStrategyFusedUpdate:
+    """Each strategy's fused update() must match update_quality() + update_sell_in()."""
+
+    @pytest.mark.parametrize(
+        "updater",
+        [NormalItemUpdater(), AgedBrieUpdater(), BackstagePassUpdater(), SulfurasUpdater()],
+        ids=lambda updater: type(updater).__name__,
+    )
+    @pytest.mark.parametrize("sell_in", [-2, -1, 0, 1, 5, 6, 10, 11, 15])
+    @pytest.mark.parametrize("quality", [-5, -1, 0, 1, 25, 49, 50, 80])
+    def test_update_matches_split_updates(self, updater, sell_in, quality):
+        """Across sell_in and quality boundaries, including out-of-range qualities."""
+        fused = Item("Item", sell_in, quality)
+        split = Item("Item", sell_in, quality)
+        updater.update(fused)
+        updater.update_quality(split)
+        updater.update_sell_in(split)
+
+        assert (fused.sell_in, fused.quality) == (split.sell_in, split.quality)
+
+    @pytest.mark.parametrize(
+        "updater",
+        [NormalItemUpdater(), AgedBrieUpdater(), BackstagePassUpdater(), SulfurasUpdater()],
+        ids=lambda updater: type(updater).__name__,
+    )
+    @pytest.mark.parametrize("sell_in", [-2, -1, 0, 1, 5, 6, 10, 11, 15])
+    @pytest.mark.parametrize("quality", [-5, -1, 0, 1, 25, 49, 50, 80])
+    def test_update_all_matches_split_updates(self, updater, sell_in, quality):
+        """update_all() updates every item of its batch once, like the split calls."""
+        batch = [Item("Item", sell_in, quality), Item("Item", sell_in, quality)]
+        split = Item("Item", sell_in, quality)
+        updater.update_all(batch)
+        updater.update_quality(split)
+        updater.update_sell_in(split)
+
+        assert [(item.sell_in, item.quality) for item in batch] == [(split.sell_in, split.quality)] * 2
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("Normal Item", "Normal Item, 4, 0"),
+            ("Aged Brie", "Aged Brie, 4, 0"),
+            ("Backstage passes to a TAFKAL80ETC concert", "Backstage passes to a TAFKAL80ETC concert, 4, 0"),
+        ],
+    )
+    def test_negative_quality_is_clamped_to_minimum(self, name, expected):
+        """Increases do not leave a negative quality below 0 either."""
+        items = [Item(name, 5, -5)]
+        GildedRose(items).update_quality()
+
+        assert repr(items[0]) == expected
+
+    def test_subclass_overrides_are_used(self):
+        """A subclass of a built-in strategy keeps its own update_quality()."""
+        class ConjuredUpdater(NormalItemUpdater):
+            def update_quality(self, item):
+                item.quality = self.clamp_quality(item.quality - 2)
+
+        items = [Item("Conjured", 5, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose._updater_factory.register_strategy("Conjured", ConjuredUpdater())
+        gilded_rose.update_quality()
+        single = Item("Conjured", 5, 10)
+        ConjuredUpdater().update(single)
+
+        assert (items[0].sell_in, items[0].quality) == (4, 8)
+        assert (single.sell_in, single.quality) == (4, 8)
+
+    def test_subclass_sell_in_hooks_are_used(self):
+        """A subclass's decrease_sell_in() and is_expired() replace the defaults."""
+        class ShelvedUpdater(NormalItemUpdater):
+            def decrease_sell_in(self, item):
+                pass
+
+        class AlwaysExpiredUpdater(NormalItemUpdater):
+            def is_expired(self, item):
+                return True
+
+        items = [Item("Shelved", 0, 10), Item("Always Expired", 5, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose._updater_factory.register_strategy("Shelved", ShelvedUpdater())
+        gilded_rose._updater_factory.register_strategy("Always Expired", AlwaysExpiredUpdater())
+        gilded_rose.update_quality()
+
+        assert [repr(item) for item in items] == ["Shelved, 0, 9", "Always Expired, 4, 8"]
+
+    def test_legendary_subclass_overrides_are_used(self):
+        """A subclass of SulfurasUpdater is not skipped as legendary."""
+        class RelicUpdater(SulfurasUpdater):
+            def update_sell_in(self, item):
+                item.sell_in -= 1
+
+        items = [Item("Relic", 5, 80)]
+        gilded_rose = GildedRose(items)
+        gilded_rose._updater_factory.register_strategy("Relic", RelicUpdater())
+        gilded_rose.update_quality()
+
+        assert (items[0].sell_in, items[0].quality) == (4, 80)
+
+    def test_subclass_constants_are_used(self):
+        """Bounds and tiers overridden on a subclass apply to its items."""
+        class CappedBrieUpdater(AgedBrieUpdater):
+            MAXIMUM_QUALITY = 30
+
+        class EarlyPassUpdater(BackstagePassUpdater):
+            DAYS_URGENT_ZONE = 20
+
+        items = [Item("Capped Brie", 5, 30), Item("Early Pass", 15, 10)]
+        gilded_rose = GildedRose(items)
+        gilded_rose._updater_factory.register_strategy("Capped Brie", CappedBrieUpdater())
+        gilded_rose._updater_factory.register_strategy("Early Pass", EarlyPassUpdater())
+        gilded_rose.update_quality()
+
+        assert [repr(item) for item in items] == ["Capped Brie, 4, 30", "Early Pass, 14, 12"]
+
+
+class TestGildedRoseBatch:
+    """GildedRoseBatch keeps arrays instead of Items but follows the same rules."""
+
+    @pytest.mark.parametrize("sell_in", [-1, 0, 1, 5, 6, 10, 11])
+    @pytest.mark.parametrize("quality", [-5, -1, 0, 1, 25, 49, 50, 80])
+    def test_matches_update_quality(self, batch_storage, sell_in, quality):
+        """Every built-in kind in one batch, from one starting state, over several days."""
+        expected = inventory(sell_in, quality)
+        scalar = GildedRose(expected)
+        batch = GildedRoseBatch(inventory(sell_in, quality))
+        for _ in range(12):
+            scalar.update_quality()
+            batch.update_quality()
+
+        assert [repr(item) for item in batch.to_items()] == [repr(item) for item in expected]
+
+    def test_transition_cache_is_bounded(self, monkeypatch):
+        """Without NumPy transitions are memoized, evicting the oldest first."""
+        monkeypatch.setattr(gilded_rose_module, "np", None)
+        monkeypatch.setattr(gilded_rose_module, "_TRANSITION_CACHE", {})
+        monkeypatch.setattr(gilded_rose_module, "_TRANSITION_CACHE_SIZE", 2)
+        batch = GildedRoseBatch([
+            Item("Normal Item", 5, 10),
+            Item("Normal Item", 5, 10),
+            Item("Aged Brie", 5, 10),
+            Item("Backstage passes to a TAFKAL80ETC concert", 5, 10),
+        ])
+        batch.update_quality()
+
+        assert [repr(item) for item in batch.to_items()] == [
+            "Normal Item, 4, 9",
+            "Normal Item, 4, 9",
+            "Aged Brie, 4, 11",
+            "Backstage passes to a TAFKAL80ETC concert, 4, 13",
+        ]
+        assert list(gilded_rose_module._TRANSITION_CACHE) == [
+            (gilded_rose_module.KIND_AGED_BRIE, 5, 10),
+            (gilded_rose_module.KIND_BACKSTAGE_PASS, 5, 10),
+        ]
+
+    def test_empty_inventory(self, batch_storage):
+        """Nothing to update is not an error."""
+        batch = GildedRoseBatch([])
+        batch.update_quality()
+
+        assert batch.to_items() == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])